@@ -9,6 +9,8 @@ import (
 	"strings"
 	"time"
 
+	"tronbyt-server/internal/tzcache"
+
 	"golang.org/x/mod/semver"
 )
 
@@ -456,6 +458,15 @@ func (j *JSONMap) Scan(value any) error {
 	default:
 		return errors.New("type assertion to []byte or string failed")
 	}
+	// Most rows hold empty values; skip the decoder for them.
+	switch string(bytes) {
+	case "null":
+		*j = nil
+		return nil
+	case "{}":
+		*j = JSONMap{}
+		return nil
+	}
 	return json.Unmarshal(bytes, j)
 }
 
@@ -480,6 +491,15 @@ func (s *StringSlice) Scan(value any) error {
 	default:
 		return errors.New("type assertion to []byte or string failed")
 	}
+	// Most rows hold empty values; skip the decoder for them.
+	switch string(bytes) {
+	case "null":
+		*s = nil
+		return nil
+	case "[]":
+		*s = StringSlice{}
+		return nil
+	}
 	return json.Unmarshal(bytes, s)
 }
 
@@ -720,11 +740,11 @@ func (d *Device) GetTimezone() string {
 func (d Device) getLocation() *time.Location {
 	loc := time.Local
 	if d.Timezone != nil {
-		if l, err := time.LoadLocation(*d.Timezone); err == nil {
+		if l, err := tzcache.LoadLocation(*d.Timezone); err == nil {
 			loc = l
 		}
 	} else if d.Location.Timezone != "" {
-		if l, err := time.LoadLocation(d.Location.Timezone); err == nil {
+		if l, err := tzcache.LoadLocation(d.Location.Timezone); err == nil {
 			loc = l
 		}
 	}
@@ -904,12 +924,18 @@ func (d Device) GetNightModeIsActive() bool {
 	if !d.NightModeEnabled {
 		return false
 	}
+	return d.GetNightModeIsActiveAt(time.Now().In(d.getLocation()))
+}
 
-	currentTime := time.Now().In(d.getLocation())
-	if d.GetNightModeOverrideActiveAt(currentTime) {
+// GetNightModeIsActiveAt checks if night mode is active at the given device-local time.
+func (d Device) GetNightModeIsActiveAt(now time.Time) bool {
+	if !d.NightModeEnabled {
+		return false
+	}
+	if d.GetNightModeOverrideActiveAt(now) {
 		return d.NightModeOverride != nil && *d.NightModeOverride
 	}
-	return d.GetScheduledNightModeIsActiveAt(currentTime)
+	return d.GetScheduledNightModeIsActiveAt(now)
 }
 
 // GetDimModeIsActive checks if dim mode is active (dimming without full night mode).
@@ -917,14 +943,21 @@ func (d Device) GetDimModeIsActive() bool {
 	if !d.DimModeEnabled {
 		return false
 	}
-	currentTime := time.Now().In(d.getLocation())
-	if d.GetNightModeIsActive() {
+	return d.GetDimModeIsActiveAt(time.Now().In(d.getLocation()))
+}
+
+// GetDimModeIsActiveAt checks if dim mode is active at the given device-local time.
+func (d Device) GetDimModeIsActiveAt(now time.Time) bool {
+	if !d.DimModeEnabled {
 		return false
 	}
-	if d.GetDimModeOverrideActiveAt(currentTime) {
+	if d.GetNightModeIsActiveAt(now) {
+		return false
+	}
+	if d.GetDimModeOverrideActiveAt(now) {
 		return d.DimModeOverride != nil && *d.DimModeOverride
 	}
-	return d.GetScheduledDimModeIsActiveAt(currentTime)
+	return d.GetScheduledDimModeIsActiveAt(now)
 }
 
 // GetEffectiveDwellTime returns the display duration for an app, falling back to the device default.
@@ -937,13 +970,22 @@ func (d *Device) GetEffectiveDwellTime(app *App) int {
 
 // GetEffectiveBrightness calculates the effective brightness of a device, accounting for night and dim modes.
 func (d *Device) GetEffectiveBrightness() int {
-	brightness := int(d.Brightness)
-	if d.GetNightModeIsActive() {
-		brightness = int(d.NightBrightness)
-	} else if d.GetDimModeIsActive() && d.DimBrightness != nil {
-		brightness = int(*d.DimBrightness)
+	if !d.NightModeEnabled && !d.DimModeEnabled {
+		return int(d.Brightness)
+	}
+	return d.GetEffectiveBrightnessAt(time.Now().In(d.getLocation()))
+}
+
+// GetEffectiveBrightnessAt calculates the effective brightness at the given device-local time.
+// The timezone is resolved once by the caller instead of once per night/dim mode check.
+func (d *Device) GetEffectiveBrightnessAt(now time.Time) int {
+	if d.GetNightModeIsActiveAt(now) {
+		return int(d.NightBrightness)
+	}
+	if d.DimBrightness != nil && d.GetDimModeIsActiveAt(now) {
+		return int(*d.DimBrightness)
 	}
-	return brightness
+	return int(d.Brightness)
 }
 
 func (d *Device) OTACapable() bool {
@@ -60,6 +60,25 @@ func TestDeviceGetDimModeIsActiveUsesManualOverride(t *testing.T) {
 	assert.True(t, device.GetDimModeIsActive())
 }
 
+func TestDeviceGetEffectiveBrightnessAt(t *testing.T) {
+	dimTime := "20:00"
+	dimBrightness := Brightness(10)
+	device := Device{
+		Brightness:       50,
+		NightModeEnabled: true,
+		NightStart:       "22:00",
+		NightEnd:         "06:00",
+		NightBrightness:  2,
+		DimModeEnabled:   true,
+		DimTime:          &dimTime,
+		DimBrightness:    &dimBrightness,
+	}
+
+	assert.Equal(t, 50, device.GetEffectiveBrightnessAt(time.Date(2026, time.April, 24, 12, 0, 0, 0, time.UTC)))
+	assert.Equal(t, 10, device.GetEffectiveBrightnessAt(time.Date(2026, time.April, 24, 21, 0, 0, 0, time.UTC)))
+	assert.Equal(t, 2, device.GetEffectiveBrightnessAt(time.Date(2026, time.April, 24, 23, 0, 0, 0, time.UTC)))
+}
+
 func TestDeviceSupportsHTTPFirmwareCommands(t *testing.T) {
 	httpDevice := Device{
 		Type: DeviceTidbytGen1,
@@ -78,3 +97,23 @@ func TestDeviceSupportsHTTPFirmwareCommands(t *testing.T) {
 	assert.False(t, wsDevice.SupportsHTTPFirmwareCommands())
 	assert.False(t, otherDevice.SupportsHTTPFirmwareCommands())
 }
+
+func TestJSONColumnScanEmptyValues(t *testing.T) {
+	var m JSONMap
+	require.NoError(t, m.Scan("null"))
+	assert.Nil(t, m)
+	require.NoError(t, m.Scan([]byte("{}")))
+	assert.NotNil(t, m)
+	assert.Empty(t, m)
+	require.NoError(t, m.Scan(`{"a":1}`))
+	assert.Equal(t, JSONMap{"a": float64(1)}, m)
+
+	var sl StringSlice
+	require.NoError(t, sl.Scan("null"))
+	assert.Nil(t, sl)
+	require.NoError(t, sl.Scan([]byte("[]")))
+	assert.NotNil(t, sl)
+	assert.Empty(t, sl)
+	require.NoError(t, sl.Scan(`["monday"]`))
+	assert.Equal(t, StringSlice{"monday"}, sl)
+}
@@ -7,6 +7,8 @@ import (
 	"log/slog"
 	"time"
 
+	"tronbyt-server/internal/tzcache"
+
 	"github.com/tronbyt/pixlet/encode"
 	"github.com/tronbyt/pixlet/runtime"
 	"github.com/tronbyt/pixlet/runtime/modules/render_runtime/canvas"
@@ -31,7 +33,7 @@ func Render(
 ) ([]byte, []string, error) {
 	location := time.Local
 	if timezone != nil && *timezone != "" {
-		v, err := time.LoadLocation(*timezone)
+		v, err := tzcache.LoadLocation(*timezone)
 		if err != nil {
 			return nil, nil, fmt.Errorf("invalid timezone: %v", err)
 		}
@@ -41,8 +41,7 @@ func (s *Server) getSettingsContentData(user *data.User) TemplateData {
 
 	var systemRepoInfo *gitutils.RepoInfo
 	if s.Config.SystemAppsRepo != "" {
-		path := filepath.Join(s.DataDir, "system-apps")
-		info, err := gitutils.GetRepoInfo(path, s.Config.SystemAppsRepo)
+		info, err := s.getSystemRepoInfo()
 		if err != nil {
 			slog.Error("Failed to get system repo info", "error", err)
 		} else {
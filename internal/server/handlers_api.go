@@ -4,7 +4,9 @@ import (
 	"context"
 	"encoding/base64"
 	"encoding/json"
+	"errors"
 	"fmt"
+	"io/fs"
 	"log/slog"
 	"net/http"
 	"os"
@@ -13,7 +15,6 @@ import (
 	"strings"
 	"time"
 
-	"tronbyt-server/internal/apps"
 	"tronbyt-server/internal/data"
 
 	securejoin "github.com/cyphar/filepath-securejoin"
@@ -338,16 +339,13 @@ func (s *Server) handlePushApp(w http.ResponseWriter, r *http.Request) {
 		}
 
 		// 1. Check System Apps
-		for _, app := range s.ListSystemApps() {
-			if app.ID == dataReq.AppID {
-				appPath = filepath.Join(s.DataDir, app.Path)
-				break
-			}
+		if app, ok := s.findSystemApp(dataReq.AppID); ok {
+			appPath = filepath.Join(s.DataDir, app.Path)
 		}
 
 		// 2. Check User Apps
 		if appPath == "" && user != nil {
-			userApps := apps.ListUserApps(s.DataDir, user.Username)
+			userApps := s.ListUserApps(user.Username)
 			for _, app := range userApps {
 				if app.ID == dataReq.AppID { // AppID for user apps is folder name
 					appPath = filepath.Join(s.DataDir, app.Path)
@@ -510,10 +508,9 @@ func (s *Server) savePushedImage(deviceID, installID, coalesceID string, data []
 		return fmt.Errorf("failed to get device webp directory: %w", err)
 	}
 
+	// The pushed directory is created lazily when the first write finds it
+	// missing, so steady-state pushes don't pay for a MkdirAll.
 	dir = filepath.Join(dir, "pushed")
-	if err := os.MkdirAll(dir, 0755); err != nil {
-		return err
-	}
 
 	var filename string
 	if installID != "" {
@@ -562,7 +559,15 @@ func (s *Server) savePushedImage(deviceID, installID, coalesceID string, data []
 	}
 
 	if err := os.WriteFile(path, data, 0644); err != nil {
-		return err
+		if !errors.Is(err, fs.ErrNotExist) {
+			return err
+		}
+		if err := os.MkdirAll(dir, 0755); err != nil {
+			return err
+		}
+		if err := os.WriteFile(path, data, 0644); err != nil {
+			return err
+		}
 	}
 
 	// Clean up anonymous ephemeral files older than 24 hours.
@@ -802,10 +807,8 @@ func (s *Server) handlePatchInstallation(w http.ResponseWriter, r *http.Request)
 			}
 			// Also check for pushed webp files
 			pushedWebpPath := filepath.Join(webpDir, "pushed", fmt.Sprintf("%s.webp", app.Iname))
-			if _, err := os.Stat(pushedWebpPath); err == nil {
-				if err := os.Remove(pushedWebpPath); err != nil {
-					slog.Error("Failed to remove pushed webp file on app disable", "path", pushedWebpPath, "error", err)
-				}
+			if err := os.Remove(pushedWebpPath); err != nil && !os.IsNotExist(err) {
+				slog.Error("Failed to remove pushed webp file on app disable", "path", pushedWebpPath, "error", err)
 			}
 		} else {
 			// Reset LastRender when app is enabled
@@ -948,6 +951,8 @@ func (s *Server) handleDeleteInstallationAPI(w http.ResponseWriter, r *http.Requ
 		return
 	}
 
+	s.forgetPreview(device.ID, app.Iname)
+
 	// Clean up files using the actual iname
 	webpDir, err := s.ensureDeviceImageDir(device.ID)
 	if err != nil {
@@ -7,6 +7,7 @@ import (
 	"fmt"
 	"html/template"
 	"io"
+	"io/fs"
 	"log/slog"
 	"maps"
 	"mime/multipart"
@@ -15,7 +16,6 @@ import (
 	"path/filepath"
 	"regexp"
 	"slices"
-	"sort"
 	"strconv"
 	"strings"
 	"time"
@@ -45,14 +45,13 @@ func (s *Server) handleAddAppGet(w http.ResponseWriter, r *http.Request) {
 	device := GetDevice(r)
 
 	systemApps := s.ListSystemApps()
-	customApps := apps.ListUserApps(s.DataDir, user.Username)
+	customApps := s.ListUserApps(user.Username)
 
 	s.markInstalledApps(device, systemApps, customApps)
 
 	var systemRepoInfo *gitutils.RepoInfo
 	if s.Config.SystemAppsRepo != "" {
-		path := filepath.Join(s.DataDir, "system-apps")
-		info, err := gitutils.GetRepoInfo(path, s.Config.SystemAppsRepo)
+		info, err := s.getSystemRepoInfo()
 		if err != nil {
 			slog.Error("Failed to get system repo info for addapp", "error", err)
 		} else {
@@ -201,7 +200,7 @@ func (s *Server) handleAddAppPost(w http.ResponseWriter, r *http.Request) {
 			http.Error(w, "Internal Server Error", http.StatusInternalServerError)
 			return
 		}
-		destPath, err := securejoin.SecureJoin(destDir, fmt.Sprintf("%s-%s.webp", newApp.Name, newApp.Iname))
+		destPath, err := securejoin.SecureJoin(destDir, appWebpName(&newApp))
 		if err != nil {
 			slog.Warn("Path traversal attempt blocked", "error", err)
 			http.Error(w, "Invalid filename", http.StatusBadRequest)
@@ -232,14 +231,14 @@ func (s *Server) handleAddAppPost(w http.ResponseWriter, r *http.Request) {
 			slog.Error("Failed to open source webp", "error", err)
 		}
 
-		s.possiblyRender(r.Context(), &newApp, device, user)
+		s.renderInBackground(r.Context(), &newApp, device, user)
 
 		http.Redirect(w, r, "/", http.StatusSeeOther)
 		return
 	}
 
 	// Trigger initial render
-	s.possiblyRender(r.Context(), &newApp, device, user)
+	s.renderInBackground(r.Context(), &newApp, device, user)
 
 	// Notify Dashboard & Device
 	s.notifyDashboard(user.Username, WSEvent{Type: "apps_changed", DeviceID: device.ID})
@@ -259,19 +258,13 @@ func (s *Server) handleAppThumbnail(w http.ResponseWriter, r *http.Request) {
 	var appMeta *apps.AppMetadata
 
 	// 1. Check system apps cache
-	s.systemAppsCacheMutex.RLock()
-	for i := range s.systemAppsCache {
-		if s.systemAppsCache[i].ID == id {
-			meta := s.systemAppsCache[i]
-			appMeta = &meta
-			break
-		}
+	if meta, ok := s.findSystemApp(id); ok {
+		appMeta = &meta
 	}
-	s.systemAppsCacheMutex.RUnlock()
 
 	// 2. If not found in system apps, check user apps (if logged in)
 	if appMeta == nil && user != nil {
-		userApps := apps.ListUserApps(s.DataDir, user.Username)
+		userApps := s.ListUserApps(user.Username)
 		for i := range userApps {
 			if userApps[i].ID == id {
 				meta := userApps[i]
@@ -313,6 +306,11 @@ func (s *Server) handleAppThumbnail(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	// The addapp page embeds a thumbnail per app. Previews only change when an
+	// app is uploaded or the repo is refreshed, so let the browser reuse them
+	// for a while; ServeFile revalidates with Last-Modified after that. User
+	// app thumbnails depend on the session, so shared caches must not store them.
+	w.Header().Set("Cache-Control", "private, max-age=3600")
 	http.ServeFile(w, r, path)
 }
 
@@ -526,8 +524,14 @@ func (s *Server) handleConfigAppPost(w http.ResponseWriter, r *http.Request) {
 		}
 	}
 
-	// Save to DB
-	if err := s.DB.Save(app).Error; err != nil {
+	// Save to DB. Only the user-editable columns are written; the render
+	// state is written by the render queued below.
+	if _, err := gorm.G[data.App](s.DB).Where("id = ?", app.ID).
+		Select("Enabled", "AutoPin", "UInterval", "DisplayTime", "Notes", "Config",
+			"UseCustomRecurrence", "RecurrenceType", "RecurrenceInterval", "RecurrencePattern",
+			"RecurrenceStartDate", "RecurrenceEndDate", "StartTime", "EndTime", "Days",
+			"ColorFilter", "ShowFullAnimation").
+		Updates(r.Context(), *app); err != nil {
 		slog.Error("Failed to save app config", "error", err)
 		http.Error(w, "Internal Server Error", http.StatusInternalServerError)
 		return
@@ -536,7 +540,7 @@ func (s *Server) handleConfigAppPost(w http.ResponseWriter, r *http.Request) {
 	// Trigger Render
 	// Force render by resetting LastRender
 	app.LastRender = time.Time{}
-	s.possiblyRender(r.Context(), app, device, user)
+	s.renderInBackground(r.Context(), app, device, user)
 
 	// Notify Dashboard & Device
 	s.notifyDashboard(user.Username, WSEvent{Type: "apps_changed", DeviceID: device.ID})
@@ -597,17 +601,30 @@ func (s *Server) handleCurrentApp(w http.ResponseWriter, r *http.Request) {
 	// The device and user are already in context due to RequireLogin and RequireDevice
 	device := GetDevice(r)
 
-	imgData, _, err := s.GetCurrentAppImage(r.Context(), device)
+	f, _, err := s.OpenCurrentAppImage(r.Context(), device)
 	if err != nil {
 		s.sendDefaultImage(w, r, device)
 		return
 	}
+	defer func() {
+		if err := f.Close(); err != nil {
+			slog.Error("Failed to close current app image", "error", err)
+		}
+	}()
 
+	info, err := f.Stat()
+	if err != nil {
+		slog.Error("Failed to stat current app image", "error", err)
+		s.sendDefaultImage(w, r, device)
+		return
+	}
+
+	// Stream the file instead of buffering it; ServeContent also answers
+	// If-Modified-Since revalidations from the dashboard with a 304.
 	w.Header().Set("Content-Type", "image/webp")
 	w.Header().Set("Cache-Control", "no-cache")
-	if _, err := w.Write(imgData); err != nil {
-		slog.Error("Failed to write current app image", "error", err)
-	}
+	w.Header().Set("ETag", webpETag(info))
+	http.ServeContent(w, r, info.Name(), info.ModTime(), f)
 }
 
 func (s *Server) handleRenderConfigPreview(w http.ResponseWriter, r *http.Request) {
@@ -632,8 +649,7 @@ func (s *Server) handleRenderConfigPreview(w http.ResponseWriter, r *http.Reques
 				s.sendDefaultImage(w, r, device)
 				return
 			}
-			if _, err := os.Stat(path); err == nil {
-				http.ServeFile(w, r, path)
+			if serveWebpFile(w, r, path) {
 				return
 			}
 		}
@@ -655,22 +671,47 @@ func (s *Server) handleRenderConfigPreview(w http.ResponseWriter, r *http.Reques
 			http.Error(w, "App path not set", http.StatusBadRequest)
 			return
 		}
-		appPath, err := securejoin.SecureJoin(s.DataDir, *app.Path)
-		if err != nil {
-			slog.Error("Failed to resolve app path", "path", *app.Path, "error", err)
-			http.Error(w, "Invalid app path", http.StatusBadRequest)
-			return
+
+		// The editor usually just pushed this exact config to the device,
+		// so reuse that render instead of running the app again. A config
+		// that can't be hashed is rendered without the cache or an ETag.
+		configHash, err := previewConfigHash(configData)
+		cacheable := err == nil
+		etag := `"` + configHash + `"`
+		var imgBytes []byte
+		cached := false
+		if cacheable {
+			imgBytes, cached = s.cachedPreview(device.ID, app.Iname, configHash)
+			if cached && r.Header.Get("If-None-Match") == etag {
+				w.WriteHeader(http.StatusNotModified)
+				return
+			}
 		}
+		if !cached {
+			appPath, err := securejoin.SecureJoin(s.DataDir, *app.Path)
+			if err != nil {
+				slog.Error("Failed to resolve app path", "path", *app.Path, "error", err)
+				http.Error(w, "Invalid app path", http.StatusBadRequest)
+				return
+			}
 
-		imgBytes, _, err := s.RenderApp(r.Context(), device, app, appPath, configData)
-		if err != nil {
-			slog.Error("Preview render failed", "error", err)
-			http.Error(w, "Render failed", http.StatusInternalServerError)
-			return
+			imgBytes, _, err = s.RenderApp(r.Context(), device, app, appPath, configData)
+			if err != nil {
+				slog.Error("Preview render failed", "error", err)
+				http.Error(w, "Render failed", http.StatusInternalServerError)
+				return
+			}
+			if cacheable {
+				s.storePreview(device.ID, app.Iname, configHash, imgBytes)
+			}
 		}
 
 		w.Header().Set("Content-Type", "image/webp")
+		w.Header().Set("Content-Length", strconv.Itoa(len(imgBytes)))
 		w.Header().Set("Cache-Control", "no-cache")
+		if cacheable {
+			w.Header().Set("ETag", etag)
+		}
 		if _, err := w.Write(imgBytes); err != nil {
 			slog.Error("Failed to write image bytes for render config preview", "error", err)
 		}
@@ -685,35 +726,14 @@ func (s *Server) handleRenderConfigPreview(w http.ResponseWriter, r *http.Reques
 		return
 	}
 
-	// For pushed apps, look up by installationID (stored in path as "pushed:{installationID}")
-	if app.Pushed && app.Path != nil && strings.HasPrefix(*app.Path, "pushed:") {
-		installationID := strings.TrimPrefix(*app.Path, "pushed:")
-		path, err := securejoin.SecureJoin(filepath.Join(webpDir, "pushed"), installationID+".webp")
-		if err != nil {
-			slog.Error("Failed to resolve pushed image path", "error", err)
-			s.sendDefaultImage(w, r, device)
-			return
-		}
-		if _, err := os.Stat(path); err == nil {
-			http.ServeFile(w, r, path)
-			return
-		}
+	// Standard app preview, falling back to the pushed subdirectory by iname
+	if serveWebpFile(w, r, filepath.Join(webpDir, appWebpName(app))) {
+		return
 	}
-
-	// Standard app preview
-	filename := fmt.Sprintf("%s-%s.webp", app.Name, app.Iname)
-	path := filepath.Join(webpDir, filename)
-
-	if _, err := os.Stat(path); os.IsNotExist(err) {
-		// Try pushed subdirectory with iname as fallback
-		path = filepath.Join(webpDir, "pushed", app.Iname+".webp")
-		if _, err := os.Stat(path); os.IsNotExist(err) {
-			s.sendDefaultImage(w, r, device)
-			return
-		}
+	if serveWebpFile(w, r, filepath.Join(webpDir, "pushed", app.Iname+".webp")) {
+		return
 	}
-
-	http.ServeFile(w, r, path)
+	s.sendDefaultImage(w, r, device)
 }
 
 func (s *Server) handlePushPreview(w http.ResponseWriter, r *http.Request) {
@@ -769,6 +789,12 @@ func (s *Server) handlePushPreview(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	// Hash before rendering; RenderApp adds $tz to the config map.
+	var configHash string
+	if configBody != nil {
+		configHash, _ = previewConfigHash(configBody)
+	}
+
 	imgBytes, messages, err := s.RenderApp(r.Context(), device, app, appPath, configBody)
 	if err != nil {
 		slog.Error("Preview render failed", "error", err)
@@ -778,6 +804,9 @@ func (s *Server) handlePushPreview(w http.ResponseWriter, r *http.Request) {
 	for _, msg := range messages {
 		slog.Debug("Preview render message", "message", msg)
 	}
+	if configHash != "" {
+		s.storePreview(device.ID, app.Iname, configHash, imgBytes)
+	}
 
 	// Push preview image to device (ephemeral)
 	if err := s.savePushedImage(device.ID, app.Iname, "", imgBytes); err != nil {
@@ -823,6 +852,8 @@ func (s *Server) handleDeleteApp(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	s.forgetPreview(device.ID, app.Iname)
+
 	// Clean up webp (outside transaction, as file system ops can't be rolled back easily)
 	webpDir, err := s.ensureDeviceImageDir(device.ID)
 	if err != nil {
@@ -889,17 +920,39 @@ func (s *Server) handleToggleEnabled(w http.ResponseWriter, r *http.Request) {
 	http.Redirect(w, r, "/", http.StatusSeeOther)
 }
 
+// saveAppOrder writes each app's index in apps as its order, updating only
+// the apps whose order changed, in one transaction. It reports whether any app
+// was updated.
+func saveAppOrder(ctx context.Context, db *gorm.DB, apps []*data.App) (bool, error) {
+	var changed []int
+	for i, app := range apps {
+		if app.Order != i {
+			changed = append(changed, i)
+		}
+	}
+	if len(changed) == 0 {
+		return false, nil
+	}
+
+	err := db.Transaction(func(tx *gorm.DB) error {
+		for _, i := range changed {
+			if _, err := gorm.G[data.App](tx).Where("id = ?", apps[i].ID).Update(ctx, "order", i); err != nil {
+				return err
+			}
+		}
+		return nil
+	})
+	return err == nil, err
+}
+
 func (s *Server) handleMoveApp(w http.ResponseWriter, r *http.Request) {
 	user := GetUser(r)
 	device := GetDevice(r)
 	targetApp := GetApp(r)
 	direction := r.FormValue("direction")
 
-	// Sort
-	appsList := slices.Clone(device.Apps)
-	sort.Slice(appsList, func(i, j int) bool {
-		return appsList[i].Order < appsList[j].Order
-	})
+	// Apps are preloaded in order; copy since the list is reordered below.
+	appsList := slices.Clone(appsInOrder(device.Apps))
 
 	idx := -1
 	for i, app := range appsList {
@@ -939,22 +992,18 @@ func (s *Server) handleMoveApp(w http.ResponseWriter, r *http.Request) {
 		}
 	}
 
-	// Save new order
-	err := s.DB.Transaction(func(tx *gorm.DB) error {
-		for i := range appsList {
-			if appsList[i].Order != i {
-				if _, err := gorm.G[data.App](tx).Where("id = ?", appsList[i].ID).Update(r.Context(), "order", i); err != nil {
-					return err
-				}
-			}
-		}
-		return nil
-	})
+	// Save new order. With contiguous orders an up/down move rewrites only the
+	// two swapped rows, and a move at the edge of the list rewrites none.
+	changed, err := saveAppOrder(r.Context(), s.DB, appsList)
 	if err != nil {
 		slog.Error("Failed to update app order", "error", err)
 		http.Error(w, "Internal Server Error", http.StatusInternalServerError)
 		return
 	}
+	if !changed {
+		w.WriteHeader(http.StatusOK)
+		return
+	}
 
 	// Notify Dashboard
 	s.notifyDashboard(user.Username, WSEvent{Type: "apps_changed", DeviceID: device.ID})
@@ -1051,10 +1100,8 @@ func (s *Server) handleReorderApps(w http.ResponseWriter, r *http.Request) {
 	targetIname := r.FormValue("target_iname")
 	insertAfter := r.FormValue("insert_after") == "true"
 
-	appsList := slices.Clone(device.Apps)
-	sort.Slice(appsList, func(i, j int) bool {
-		return appsList[i].Order < appsList[j].Order
-	})
+	// Apps are preloaded in order; copy since the list is reordered below.
+	appsList := slices.Clone(appsInOrder(device.Apps))
 
 	draggedIdx := -1
 	targetIdx := -1
@@ -1091,22 +1138,18 @@ func (s *Server) handleReorderApps(w http.ResponseWriter, r *http.Request) {
 		appsList[targetIdx] = app
 	}
 
-	// Save new order
-	err := s.DB.Transaction(func(tx *gorm.DB) error {
-		for i := range appsList {
-			if appsList[i].Order != i {
-				if _, err := gorm.G[data.App](tx).Where("id = ?", appsList[i].ID).Update(r.Context(), "order", i); err != nil {
-					return err
-				}
-			}
-		}
-		return nil
-	})
+	// Save new order. Dropping an app renumbers every app between its old and
+	// new position; apps outside that range keep their order and aren't written.
+	changed, err := saveAppOrder(r.Context(), s.DB, appsList)
 	if err != nil {
 		slog.Error("Failed to update app order", "error", err)
 		http.Error(w, "Internal Server Error", http.StatusInternalServerError)
 		return
 	}
+	if !changed {
+		w.WriteHeader(http.StatusOK)
+		return
+	}
 
 	// Notify Dashboard
 	s.notifyDashboard(user.Username, WSEvent{Type: "apps_changed", DeviceID: device.ID})
@@ -1121,11 +1164,22 @@ func (s *Server) handleUploadAppGet(w http.ResponseWriter, r *http.Request) {
 	s.renderTemplate(w, r, "uploadapp", TemplateData{User: user, Device: device})
 }
 
+// maxAppUploadSize caps the request body of an app upload. Uploads beyond the
+// in-memory multipart limit are spooled to disk, so without a cap a client
+// could fill the temp directory.
+const maxAppUploadSize = 64 << 20
+
+// appUploadMemory is how much of an upload is held in memory. .star files fit
+// well within it; larger zips spool to a temp file, which is then unzipped or
+// copied from disk instead of being buffered in the heap.
+const appUploadMemory = 1 << 20
+
 func (s *Server) handleUploadAppPost(w http.ResponseWriter, r *http.Request) {
 	user := GetUser(r)
 	device := GetDevice(r)
 
-	if err := r.ParseMultipartForm(10 << 20); err != nil {
+	r.Body = http.MaxBytesReader(w, r.Body, maxAppUploadSize)
+	if err := r.ParseMultipartForm(appUploadMemory); err != nil {
 		http.Error(w, "File too large", http.StatusBadRequest)
 		return
 	}
@@ -1158,6 +1212,7 @@ func (s *Server) handleUploadAppPost(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 	previewDir := appDir
+	defer s.invalidateUserAppsCache(user.Username)
 
 	// Handle zip files specifically
 	if ext == ".zip" {
@@ -1233,37 +1288,11 @@ func (s *Server) parseManifest(tempExtractDir string) (string, error) {
 	return "", nil
 }
 
-func (s *Server) handleZipUpload(w http.ResponseWriter, r *http.Request, user *data.User, device *data.Device, file io.Reader, header *multipart.FileHeader, appName string) error {
+func (s *Server) handleZipUpload(w http.ResponseWriter, r *http.Request, user *data.User, device *data.Device, file multipart.File, header *multipart.FileHeader, appName string) error {
 	userAppsDir := filepath.Join(s.DataDir, "users", user.Username, "apps")
 
-	tmpDir := s.GetTmpDir()
-
-	// Save the zip file temporarily
-	tempZip, err := os.CreateTemp(tmpDir, "upload-*.zip")
-	if err != nil {
-		slog.Error("Failed to create temp zip file", "error", err)
-		return err
-	}
-	defer func() {
-		if err := os.Remove(tempZip.Name()); err != nil {
-			slog.Error("Failed to remove temp zip file", "error", err)
-		}
-	}()
-
-	if _, err := io.Copy(tempZip, file); err != nil {
-		slog.Error("Failed to write temp zip file", "error", err)
-		if cerr := tempZip.Close(); cerr != nil {
-			slog.Error("Failed to close temp zip file after error", "error", cerr)
-		}
-		return err
-	}
-	if err := tempZip.Close(); err != nil {
-		slog.Error("Failed to close temp zip file", "error", err)
-		return err
-	}
-
 	// Create a temp dir for extraction
-	tempExtractDir, err := os.MkdirTemp(tmpDir, "app-extract-*")
+	tempExtractDir, err := os.MkdirTemp(s.GetTmpDir(), "app-extract-*")
 	if err != nil {
 		slog.Error("Failed to create temp extract dir", "error", err)
 		return err
@@ -1274,8 +1303,9 @@ func (s *Server) handleZipUpload(w http.ResponseWriter, r *http.Request, user *d
 		}
 	}()
 
-	// Unzip contents to temp dir
-	if err := s.unzip(tempZip.Name(), tempExtractDir); err != nil {
+	// Unzip contents to temp dir. The multipart file is already held in
+	// memory or spooled to disk, so read the archive from it directly.
+	if err := s.unzip(file, header.Size, tempExtractDir); err != nil {
 		slog.Error("Failed to unzip file", "error", err)
 		return err
 	}
@@ -1353,8 +1383,11 @@ func (s *Server) generatePreview(ctx context.Context, device *data.Device, appDi
 	}
 }
 
+// copyDir copies the tree at src into dst. It walks with WalkDir, which uses
+// the directory entry types instead of an lstat per file; only directories
+// are stat'ed, to carry over their permissions.
 func copyDir(src string, dst string) error {
-	return filepath.Walk(src, func(path string, info os.FileInfo, err error) error {
+	return filepath.WalkDir(src, func(path string, d fs.DirEntry, err error) error {
 		if err != nil {
 			return err
 		}
@@ -1366,11 +1399,15 @@ func copyDir(src string, dst string) error {
 
 		dstPath := filepath.Join(dst, relPath)
 
-		if info.IsDir() {
+		if d.IsDir() {
+			info, err := d.Info()
+			if err != nil {
+				return err
+			}
 			return os.MkdirAll(dstPath, info.Mode())
 		}
 
-		if info.Mode()&os.ModeSymlink != 0 {
+		if d.Type()&fs.ModeSymlink != 0 {
 			// Skip symlinks for safety
 			return nil
 		}
@@ -1379,16 +1416,11 @@ func copyDir(src string, dst string) error {
 	})
 }
 
-func (s *Server) unzip(src, dest string) error {
-	r, err := zip.OpenReader(src)
+func (s *Server) unzip(src io.ReaderAt, size int64, dest string) error {
+	r, err := zip.NewReader(src, size)
 	if err != nil {
 		return err
 	}
-	defer func() {
-		if err := r.Close(); err != nil {
-			slog.Error("Failed to close zip reader", "error", err)
-		}
-	}()
 	for _, f := range r.File {
 		// securejoin to prevent zip slip
 		fpath, err := securejoin.SecureJoin(dest, f.Name)
@@ -1456,33 +1488,28 @@ func (s *Server) handleDeleteUpload(w http.ResponseWriter, r *http.Request) {
 
 	user := GetUser(r)
 
-	// user.Devices is already preloaded by RequireLogin -> RequireDevice -> RequireUser, but GetUser in current implementation doesn't preload.
-	// We need to fetch user with devices and apps here.
-	userWithDevices, err := gorm.G[data.User](s.DB).Preload("Devices.Apps", nil).Where("username = ?", user.Username).First(r.Context())
-	if err != nil {
-		http.Error(w, "User not found", http.StatusInternalServerError)
+	// Only the installed paths across the user's devices are needed to tell
+	// whether the upload is in use, so fetch that one column rather than
+	// preloading every device and app row.
+	var installedPaths []string
+	if err := s.DB.WithContext(r.Context()).Model(&data.App{}).
+		Where("device_id IN (?)", s.DB.Model(&data.Device{}).Select("id").Where("username = ?", user.Username)).
+		Where("path IS NOT NULL").
+		Pluck("path", &installedPaths).Error; err != nil {
+		slog.Error("Failed to list installed app paths", "error", err)
+		http.Error(w, "Internal Server Error", http.StatusInternalServerError)
 		return
 	}
 
-	inUse := false
-	for _, dev := range userWithDevices.Devices {
-		for _, app := range dev.Apps {
-			if app.Path != nil && filepath.Base(*app.Path) == filename {
-				inUse = true
-				break
-			}
-		}
-		if inUse {
-			break
-		}
-	}
-
+	inUse := slices.ContainsFunc(installedPaths, func(path string) bool {
+		return filepath.Base(path) == filename
+	})
 	if inUse {
 		s.flashAndRedirect(w, r, fmt.Sprintf("Cannot delete %s because it is installed on a device.", filename), fmt.Sprintf("/devices/%s/addapp", id), http.StatusSeeOther)
 		return
 	}
 
-	userAppsPath := filepath.Join(s.DataDir, "users", userWithDevices.Username, "apps")
+	userAppsPath := filepath.Join(s.DataDir, "users", user.Username, "apps")
 	appName := strings.TrimSuffix(filename, filepath.Ext(filename))
 	appDir, err := securejoin.SecureJoin(userAppsPath, appName)
 	if err != nil {
@@ -1494,6 +1521,7 @@ func (s *Server) handleDeleteUpload(w http.ResponseWriter, r *http.Request) {
 	if err := os.RemoveAll(appDir); err != nil {
 		slog.Error("Failed to remove app upload dir", "path", appDir, "error", err)
 	}
+	s.invalidateUserAppsCache(user.Username)
 
 	http.Redirect(w, r, fmt.Sprintf("/devices/%s/addapp", id), http.StatusSeeOther)
 }
@@ -1512,8 +1540,9 @@ func (s *Server) updateAppBrokenStatus(w http.ResponseWriter, r *http.Request, b
 		return
 	}
 
-	appName := r.URL.Query().Get("app_name")
-	packageName := r.URL.Query().Get("package_name")
+	query := r.URL.Query()
+	appName := query.Get("app_name")
+	packageName := query.Get("package_name")
 
 	if appName == "" {
 		http.Error(w, "App name is required", http.StatusBadRequest)
@@ -1548,7 +1577,7 @@ func (s *Server) updateAppBrokenStatus(w http.ResponseWriter, r *http.Request, b
 
 	manifest.Broken = &broken
 	if broken {
-		reason := r.URL.Query().Get("broken_reason")
+		reason := query.Get("broken_reason")
 		if reason == "" {
 			reason = "Marked broken by user"
 		}
@@ -1676,17 +1705,14 @@ func (s *Server) performAppDuplication(ctx context.Context, user *data.User, sou
 				}
 				targetWebpPath := filepath.Join(targetPushedWebpDir, fmt.Sprintf("%s.webp", newIname))
 
-				if _, err := os.Stat(sourceWebpPath); err == nil {
-					if err := copyFile(sourceWebpPath, targetWebpPath); err != nil {
-						slog.Error("Failed to copy pushed image", "source", sourceWebpPath, "target", targetWebpPath, "error", err)
-					}
-				} else if !os.IsNotExist(err) {
-					slog.Error("Failed to stat source pushed image", "path", sourceWebpPath, "error", err)
+				// A missing source just means nothing was pushed yet
+				if err := copyFile(sourceWebpPath, targetWebpPath); err != nil && !os.IsNotExist(err) {
+					slog.Error("Failed to copy pushed image", "source", sourceWebpPath, "target", targetWebpPath, "error", err)
 				}
 			}
 		}
 	}
-	s.possiblyRender(ctx, &duplicatedApp, targetDevice, user)
+	s.renderInBackground(ctx, &duplicatedApp, targetDevice, user)
 
 	return nil
 }
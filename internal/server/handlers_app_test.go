@@ -30,7 +30,7 @@ func TestHandleAddAppPost(t *testing.T) {
 	s.DB.Create(&device)
 
 	// Mock SystemAppsCache
-	s.systemAppsCache = []apps.AppMetadata{
+	s.setSystemAppsCache([]apps.AppMetadata{
 		{
 			Manifest: apps.Manifest{
 				ID:                  "Clock",
@@ -38,7 +38,7 @@ func TestHandleAddAppPost(t *testing.T) {
 			},
 			Path: "system-apps/apps/clock",
 		},
-	}
+	})
 
 	form := url.Values{}
 	form.Add("name", "Clock")
@@ -701,3 +701,81 @@ func TestMarkInstalledApps_AbsolutePaths(t *testing.T) {
 
 	assert.True(t, systemApps[0].IsInstalled, "Weather should be installed (absolute to relative conversion match)")
 }
+
+func TestCopyDir(t *testing.T) {
+	src := t.TempDir()
+	assert.NoError(t, os.MkdirAll(filepath.Join(src, "images"), 0755))
+	assert.NoError(t, os.WriteFile(filepath.Join(src, "app.star"), []byte("def main(): pass"), 0644))
+	assert.NoError(t, os.WriteFile(filepath.Join(src, "images", "icon.png"), []byte("png"), 0644))
+	assert.NoError(t, os.Symlink("/etc/passwd", filepath.Join(src, "link")))
+
+	dst := filepath.Join(t.TempDir(), "app")
+	assert.NoError(t, copyDir(src, dst))
+
+	got, err := os.ReadFile(filepath.Join(dst, "images", "icon.png"))
+	assert.NoError(t, err)
+	assert.Equal(t, "png", string(got))
+	_, err = os.Lstat(filepath.Join(dst, "link"))
+	assert.True(t, os.IsNotExist(err), "symlinks should not be copied")
+}
+
+func TestHandleDeleteUpload_SkipsInstalledApps(t *testing.T) {
+	s := newTestServer(t)
+
+	user := data.User{Username: "testuser"}
+	s.DB.Create(&user)
+	device := data.Device{ID: "testdevice", Username: "testuser"}
+	s.DB.Create(&device)
+	installedPath := "users/testuser/apps/installed/installed.star"
+	s.DB.Create(&data.App{DeviceID: "testdevice", Iname: "100", Name: "installed", Path: &installedPath})
+
+	appsDir := filepath.Join(s.DataDir, "users", "testuser", "apps")
+	for _, name := range []string{"installed", "unused"} {
+		assert.NoError(t, os.MkdirAll(filepath.Join(appsDir, name), 0755))
+	}
+
+	deleteUpload := func(filename string) {
+		req, _ := http.NewRequest(http.MethodGet, "/devices/testdevice/uploads/"+filename+"/delete", nil)
+		req.SetPathValue("id", "testdevice")
+		req.SetPathValue("filename", filename)
+		req = req.WithContext(context.WithValue(req.Context(), userContextKey, &user))
+		rr := httptest.NewRecorder()
+		s.handleDeleteUpload(rr, req)
+		assert.Equal(t, http.StatusSeeOther, rr.Code)
+	}
+
+	deleteUpload("installed.star")
+	assert.DirExists(t, filepath.Join(appsDir, "installed"), "an installed upload must not be deleted")
+
+	deleteUpload("unused.star")
+	assert.NoDirExists(t, filepath.Join(appsDir, "unused"))
+}
+
+func TestSaveAppOrder(t *testing.T) {
+	s := newTestServer(t)
+	s.DB.Create(&data.User{Username: "testuser"})
+	s.DB.Create(&data.Device{ID: "testdevice", Username: "testuser"})
+	var apps []*data.App
+	for i, iname := range []string{"100", "101", "102"} {
+		app := &data.App{DeviceID: "testdevice", Iname: iname, Order: i}
+		s.DB.Create(app)
+		apps = append(apps, app)
+	}
+
+	changed, err := saveAppOrder(context.Background(), s.DB, apps)
+	assert.NoError(t, err)
+	assert.False(t, changed, "unchanged order should not be written")
+
+	apps[0], apps[2] = apps[2], apps[0]
+	changed, err = saveAppOrder(context.Background(), s.DB, apps)
+	assert.NoError(t, err)
+	assert.True(t, changed)
+
+	saved, err := gorm.G[data.Device](s.DB).Preload("Apps", orderedAppsPreload).Where("id = ?", "testdevice").First(context.Background())
+	assert.NoError(t, err)
+	var inames []string
+	for _, app := range saved.Apps {
+		inames = append(inames, app.Iname)
+	}
+	assert.Equal(t, []string{"102", "101", "100"}, inames)
+}
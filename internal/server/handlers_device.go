@@ -2,10 +2,10 @@ package server
 
 import (
 	"encoding/json"
+	"errors"
 	"fmt"
 	"log/slog"
 	"net/http"
-	"os"
 	"regexp"
 	"strconv"
 	"strings"
@@ -636,18 +636,12 @@ func (s *Server) handleDeleteDevice(w http.ResponseWriter, r *http.Request) {
 	device := GetDevice(r)
 
 	// Clean up files
-	deviceWebpDir, err := s.ensureDeviceImageDir(device.ID)
-	if err != nil {
-		slog.Error("Failed to get device webp directory for deletion", "device_id", device.ID, "error", err)
-		http.Error(w, "Internal Server Error", http.StatusInternalServerError)
-		return
-	}
-	if err := os.RemoveAll(deviceWebpDir); err != nil {
+	if err := s.removeDeviceImageDir(device.ID); err != nil {
 		slog.Error("Failed to remove device webp directory", "device_id", device.ID, "error", err)
 	}
 
 	// Cascading delete in transaction
-	err = s.DB.Transaction(func(tx *gorm.DB) error {
+	err := s.DB.Transaction(func(tx *gorm.DB) error {
 		// 1. Delete Apps
 		if _, err := gorm.G[data.App](tx).Where("device_id = ?", device.ID).Delete(r.Context()); err != nil {
 			return err
@@ -698,18 +692,39 @@ func (s *Server) handleExportDeviceConfig(w http.ResponseWriter, r *http.Request
 	}
 }
 
+// maxConfigImportSize caps the size of an imported config file. The request
+// body is capped too, with maxConfigImportOverhead of room for the multipart
+// framing around the file: the multipart memory limit alone only decides when
+// the upload spools to disk, so an oversized file would otherwise still be
+// written out and decoded in full.
+const (
+	maxConfigImportSize     = 1 << 20
+	maxConfigImportOverhead = 64 << 10
+)
+
+// isBodyTooLarge reports whether err comes from a request body that exceeded
+// its http.MaxBytesReader limit.
+func isBodyTooLarge(err error) bool {
+	var maxErr *http.MaxBytesError
+	return errors.As(err, &maxErr)
+}
+
 func (s *Server) handleImportDeviceConfig(w http.ResponseWriter, r *http.Request) {
 	user := GetUser(r)
 	device := GetDevice(r)
 
-	// Max 1MB file size
-	if err := r.ParseMultipartForm(1 << 20); err != nil {
+	r.Body = http.MaxBytesReader(w, r.Body, maxConfigImportSize+maxConfigImportOverhead)
+	if err := r.ParseMultipartForm(maxConfigImportSize); err != nil {
 		slog.Error("Failed to parse multipart form for device import", "error", err)
+		if isBodyTooLarge(err) {
+			s.flashAndRedirect(w, r, "File upload failed: file too large", fmt.Sprintf("/devices/%s/update", device.ID), http.StatusSeeOther)
+			return
+		}
 		s.flashAndRedirect(w, r, "File upload failed: invalid form data", fmt.Sprintf("/devices/%s/update", device.ID), http.StatusSeeOther)
 		return
 	}
 
-	file, _, err := r.FormFile("file")
+	file, header, err := r.FormFile("file")
 	if err != nil {
 		slog.Error("Failed to get uploaded file for device import", "error", err)
 		s.flashAndRedirect(w, r, "File upload failed", fmt.Sprintf("/devices/%s/update", device.ID), http.StatusSeeOther)
@@ -720,6 +735,10 @@ func (s *Server) handleImportDeviceConfig(w http.ResponseWriter, r *http.Request
 			slog.Error("Failed to close uploaded device config file", "error", err)
 		}
 	}()
+	if header.Size > maxConfigImportSize {
+		s.flashAndRedirect(w, r, "File upload failed: file too large", fmt.Sprintf("/devices/%s/update", device.ID), http.StatusSeeOther)
+		return
+	}
 
 	var importedDevice data.Device
 	if err := json.NewDecoder(file).Decode(&importedDevice); err != nil {
@@ -729,14 +748,7 @@ func (s *Server) handleImportDeviceConfig(w http.ResponseWriter, r *http.Request
 	}
 
 	// Clean up WebP files for this device to prevent orphans
-	deviceWebpDir, err := s.ensureDeviceImageDir(device.ID)
-	if err != nil {
-		slog.Error("Failed to get device webp directory for cleanup during import", "device_id", device.ID, "error", err)
-		s.flashAndRedirect(w, r, "Import failed: internal server error.", fmt.Sprintf("/devices/%s/update", device.ID), http.StatusSeeOther)
-		return
-	}
-
-	if err := os.RemoveAll(deviceWebpDir); err != nil {
+	if err := s.removeDeviceImageDir(device.ID); err != nil {
 		slog.Error("Failed to clear device webp directory during import", "device_id", device.ID, "error", err)
 	}
 	// Re-create the directory immediately
@@ -789,16 +801,20 @@ func (s *Server) handleImportDeviceConfig(w http.ResponseWriter, r *http.Request
 		device.SwapColors = importedDevice.SwapColors
 		device.RequireAPIKey = importedDevice.RequireAPIKey
 
-		if err := tx.Save(device).Error; err != nil {
+		// The preloaded Apps are the ones just deleted; saving them as an
+		// association would write them straight back.
+		if err := tx.Omit("Apps").Save(device).Error; err != nil {
 			return fmt.Errorf("failed to save updated device: %w", err)
 		}
 
-		// 3. Create new apps from imported device
+		// 3. Create new apps from imported device in a single insert
 		for _, app := range importedDevice.Apps {
 			app.DeviceID = device.ID // Ensure DeviceID is set to the current device's ID
 			app.ID = 0               // GORM will assign a new primary key
-			if err := tx.Create(&app).Error; err != nil {
-				return fmt.Errorf("failed to create imported app '%s': %w", app.Name, err)
+		}
+		if len(importedDevice.Apps) > 0 {
+			if err := tx.Create(importedDevice.Apps).Error; err != nil {
+				return fmt.Errorf("failed to create imported apps: %w", err)
 			}
 		}
 
@@ -834,7 +850,9 @@ func (s *Server) handleUpdateBrightness(w http.ResponseWriter, r *http.Request)
 
 	device.Brightness = data.BrightnessFromUIScale(bUI, customScale)
 
-	if err := s.DB.Omit("Apps").Save(device).Error; err != nil {
+	// Slider changes only touch one column; a full Save would also write back
+	// (and could clobber) state like last_app_index that polls update.
+	if _, err := gorm.G[data.Device](s.DB).Where("id = ?", device.ID).Update(r.Context(), "brightness", device.Brightness); err != nil {
 		slog.Error("Failed to update device brightness", "device", device.ID, "error", err)
 		http.Error(w, "Internal Server Error", http.StatusInternalServerError)
 		return
@@ -867,7 +885,7 @@ func (s *Server) handleUpdateInterval(w http.ResponseWriter, r *http.Request) {
 
 	device.DefaultInterval = interval
 
-	if err := s.DB.Omit("Apps").Save(device).Error; err != nil {
+	if _, err := gorm.G[data.Device](s.DB).Where("id = ?", device.ID).Update(r.Context(), "default_interval", interval); err != nil {
 		slog.Error("Failed to update device interval", "device", device.ID, "error", err)
 		http.Error(w, "Internal Server Error", http.StatusInternalServerError)
 		return
@@ -974,14 +992,18 @@ func (s *Server) setModeOverride(w http.ResponseWriter, r *http.Request, mode st
 func (s *Server) handleImportNewDeviceConfig(w http.ResponseWriter, r *http.Request) {
 	user := GetUser(r)
 
-	// Max 1MB file size
-	if err := r.ParseMultipartForm(1 << 20); err != nil {
+	r.Body = http.MaxBytesReader(w, r.Body, maxConfigImportSize+maxConfigImportOverhead)
+	if err := r.ParseMultipartForm(maxConfigImportSize); err != nil {
 		slog.Error("Failed to parse multipart form for device import", "error", err)
+		if isBodyTooLarge(err) {
+			http.Error(w, "File too large", http.StatusRequestEntityTooLarge)
+			return
+		}
 		http.Error(w, "File upload failed: invalid form data", http.StatusBadRequest)
 		return
 	}
 
-	file, _, err := r.FormFile("file")
+	file, header, err := r.FormFile("file")
 	if err != nil {
 		slog.Error("Failed to get uploaded file for device import", "error", err)
 		http.Error(w, "File upload failed", http.StatusBadRequest)
@@ -992,6 +1014,10 @@ func (s *Server) handleImportNewDeviceConfig(w http.ResponseWriter, r *http.Requ
 			slog.Error("Failed to close uploaded device config file", "error", err)
 		}
 	}()
+	if header.Size > maxConfigImportSize {
+		http.Error(w, "File too large", http.StatusRequestEntityTooLarge)
+		return
+	}
 
 	var importedDevice data.Device
 	if err := json.NewDecoder(file).Decode(&importedDevice); err != nil {
@@ -1082,12 +1108,14 @@ func (s *Server) handleImportNewDeviceConfig(w http.ResponseWriter, r *http.Requ
 			return fmt.Errorf("failed to create device: %w", err)
 		}
 
-		// Create apps
+		// Create apps in a single insert
 		for _, app := range importedDevice.Apps {
 			app.DeviceID = newDevice.ID
 			app.ID = 0 // Reset ID to allow GORM to generate new one
-			if err := tx.Create(&app).Error; err != nil {
-				return fmt.Errorf("failed to create app '%s': %w", app.Name, err)
+		}
+		if len(importedDevice.Apps) > 0 {
+			if err := tx.Create(importedDevice.Apps).Error; err != nil {
+				return fmt.Errorf("failed to create apps: %w", err)
 			}
 		}
 		return nil
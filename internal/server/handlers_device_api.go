@@ -28,7 +28,7 @@ func (s *Server) handleNextApp(w http.ResponseWriter, r *http.Request) {
 		}
 	} else {
 		// Fallback: Fetch from DB directly (No Auth required for device operation)
-		d, err := gorm.G[data.Device](s.DB).Preload("Apps", nil).Where("id = ?", id).First(r.Context())
+		d, err := gorm.G[data.Device](s.DB).Preload("Apps", orderedAppsPreload).Where("id = ?", id).First(r.Context())
 		if err == nil {
 			device = &d
 		}
@@ -47,60 +47,63 @@ func (s *Server) handleNextApp(w http.ResponseWriter, r *http.Request) {
 	}
 
 	if len(device.Apps) == 0 {
-		reloaded, err := gorm.G[data.Device](s.DB).Preload("Apps", nil).Where("id = ?", device.ID).First(r.Context())
+		reloaded, err := gorm.G[data.Device](s.DB).Preload("Apps", orderedAppsPreload).Where("id = ?", device.ID).First(r.Context())
 		if err == nil {
 			device = &reloaded
 		}
 	}
 
+	// Rotation only needs the owner's username (for dashboard notifications),
+	// which the device row already carries, so unauthenticated device polls
+	// don't pay for a second query to load the owner.
 	user, _ := UserFromContext(r.Context())
 	if user == nil {
-		owner, err := gorm.G[data.User](s.DB).Where("username = ?", device.Username).First(r.Context())
-		if err != nil {
-			slog.Error("Failed to find device owner", "username", device.Username, "error", err)
-			http.Error(w, "Internal Server Error", http.StatusInternalServerError)
-			return
-		}
-		user = &owner
+		user = &data.User{Username: device.Username}
 	}
 
-	// Update device info if needed
-	// We use a transaction with locking to avoid race conditions with other requests
-	err := s.DB.Transaction(func(tx *gorm.DB) error {
-		// Lock the row to ensure we read the latest state and no one else updates it
-		freshDevice, err := gorm.G[data.Device](tx, clause.Locking{Strength: "UPDATE"}).Where("id = ?", device.ID).First(r.Context())
-		if err != nil {
-			return err
-		}
-
-		updated := false
-		if freshDevice.Info.ProtocolType != data.ProtocolHTTP {
-			slog.Debug("Updating protocol_type to HTTP on /next request", "device", device.ID)
-			freshDevice.Info.ProtocolType = data.ProtocolHTTP
-			updated = true
-		}
+	// Update device info if needed. The device was loaded for this request, so
+	// steady-state polls whose info already matches skip the transaction.
+	fwVersion := r.Header.Get("X-Firmware-Version")
+	infoStale := device.Info.ProtocolType != data.ProtocolHTTP ||
+		(fwVersion != "" && device.Info.FirmwareVersion != fwVersion)
+
+	if infoStale {
+		// We use a transaction with locking to avoid race conditions with other requests
+		err := s.DB.Transaction(func(tx *gorm.DB) error {
+			// Lock the row to ensure we read the latest state and no one else updates it
+			freshDevice, err := gorm.G[data.Device](tx, clause.Locking{Strength: "UPDATE"}).Where("id = ?", device.ID).First(r.Context())
+			if err != nil {
+				return err
+			}
 
-		// Check for firmware version header
-		if fwVersion := r.Header.Get("X-Firmware-Version"); fwVersion != "" {
-			if freshDevice.Info.FirmwareVersion != fwVersion {
-				slog.Debug("Updating firmware_version on /next request", "device", device.ID, "version", fwVersion)
-				freshDevice.Info.FirmwareVersion = fwVersion
+			updated := false
+			if freshDevice.Info.ProtocolType != data.ProtocolHTTP {
+				slog.Debug("Updating protocol_type to HTTP on /next request", "device", device.ID)
+				freshDevice.Info.ProtocolType = data.ProtocolHTTP
 				updated = true
 			}
-		}
 
-		if updated {
-			if _, err := gorm.G[data.Device](tx).Where("id = ?", freshDevice.ID).Update(r.Context(), "info", freshDevice.Info); err != nil {
-				return err
+			// Check for firmware version header
+			if fwVersion != "" {
+				if freshDevice.Info.FirmwareVersion != fwVersion {
+					slog.Debug("Updating firmware_version on /next request", "device", device.ID, "version", fwVersion)
+					freshDevice.Info.FirmwareVersion = fwVersion
+					updated = true
+				}
 			}
-			// Update the in-memory device object so subsequent logic uses the new values
-			device.Info = freshDevice.Info
-		}
-		return nil
-	})
 
-	if err != nil {
-		slog.Error("Failed to update device info transaction", "device", device.ID, "error", err)
+			if updated {
+				if _, err := gorm.G[data.Device](tx).Where("id = ?", freshDevice.ID).Update(r.Context(), "info", freshDevice.Info); err != nil {
+					return err
+				}
+				// Update the in-memory device object so subsequent logic uses the new values
+				device.Info = freshDevice.Info
+			}
+			return nil
+		})
+		if err != nil {
+			slog.Error("Failed to update device info transaction", "device", device.ID, "error", err)
+		}
 	}
 
 	imgData, app, err := s.GetNextAppImage(r.Context(), device, user)
@@ -113,9 +116,12 @@ func (s *Server) handleNextApp(w http.ResponseWriter, r *http.Request) {
 
 	// For HTTP devices, we assume "Sent" equals "Displaying" (or roughly so).
 	// We update DisplayingApp here so the Preview uses the explicit field instead of fallback.
-	if app != nil {
+	if app != nil && (device.DisplayingApp == nil || *device.DisplayingApp != app.Iname) {
 		if _, err := gorm.G[data.Device](s.DB).Where("id = ?", device.ID).Update(r.Context(), "displaying_app", app.Iname); err != nil {
 			slog.Error("Failed to update displaying_app for HTTP device", "device", device.ID, "error", err)
+		} else {
+			iname := app.Iname
+			device.DisplayingApp = &iname
 		}
 	}
 
@@ -1,7 +1,9 @@
 package server
 
 import (
+	"bytes"
 	"context"
+	"mime/multipart"
 	"net/http"
 	"net/http/httptest"
 	"net/url"
@@ -147,6 +149,9 @@ func TestHandleUpdateBrightness(t *testing.T) {
 	}
 	s.DB.Create(&device)
 
+	// A poll advances the rotation after the handler's copy was loaded.
+	s.DB.Model(&data.Device{}).Where("id = ?", "testdevice").Update("last_app_index", 3)
+
 	bUI := 4 // Define bUI here
 
 	form := url.Values{}
@@ -174,6 +179,9 @@ func TestHandleUpdateBrightness(t *testing.T) {
 	if updatedDevice.Brightness != expectedBrightness {
 		t.Errorf("Brightness not updated correctly: got %v want %v", updatedDevice.Brightness, expectedBrightness)
 	}
+	if updatedDevice.LastAppIndex != 3 {
+		t.Errorf("LastAppIndex was overwritten: got %d want 3", updatedDevice.LastAppIndex)
+	}
 }
 
 func TestHandleUpdateBrightness_Invalid(t *testing.T) {
@@ -364,3 +372,94 @@ func TestHandleSetDimModeOverride(t *testing.T) {
 	assert.True(t, *updatedDevice.DimModeOverride)
 	assert.True(t, updatedDevice.DimModeOverrideUntil.After(time.Now().Add(-time.Minute)))
 }
+
+func TestHandleImportDeviceConfig_ReplacesApps(t *testing.T) {
+	s := newTestServer(t)
+
+	user := data.User{Username: "testuser"}
+	require.NoError(t, s.DB.Create(&user).Error)
+	require.NoError(t, s.DB.Create(&data.Device{ID: "testdevice", Username: "testuser", Name: "Old"}).Error)
+	require.NoError(t, s.DB.Create(&data.App{DeviceID: "testdevice", Iname: "100", Name: "old"}).Error)
+
+	// Middleware hands the handler the device with its current apps preloaded.
+	device, err := gorm.G[data.Device](s.DB).Preload("Apps", orderedAppsPreload).Where("id = ?", "testdevice").First(context.Background())
+	require.NoError(t, err)
+	require.Len(t, device.Apps, 1)
+
+	body := &bytes.Buffer{}
+	mw := multipart.NewWriter(body)
+	part, err := mw.CreateFormFile("file", "device.json")
+	require.NoError(t, err)
+	_, err = part.Write([]byte(`{"name": "Imported", "apps": [{"iname": "200", "name": "first"}, {"iname": "201", "name": "second"}]}`))
+	require.NoError(t, err)
+	require.NoError(t, mw.Close())
+
+	req, _ := http.NewRequest(http.MethodPost, "/devices/testdevice/import_config", body)
+	req.Header.Set("Content-Type", mw.FormDataContentType())
+	ctx := context.WithValue(req.Context(), userContextKey, &user)
+	ctx = context.WithValue(ctx, deviceContextKey, &device)
+	req = req.WithContext(ctx)
+
+	rr := httptest.NewRecorder()
+	s.handleImportDeviceConfig(rr, req)
+	assert.Equal(t, http.StatusSeeOther, rr.Code)
+
+	apps, err := gorm.G[data.App](s.DB).Where("device_id = ?", "testdevice").Order("iname").Find(context.Background())
+	require.NoError(t, err)
+	var inames []string
+	for _, app := range apps {
+		inames = append(inames, app.Iname)
+	}
+	assert.Equal(t, []string{"200", "201"}, inames, "imported apps should replace the existing ones")
+}
+
+func TestHandleImportNewDeviceConfig_SizeLimit(t *testing.T) {
+	// configOfSize returns a valid device config of exactly n bytes.
+	configOfSize := func(n int) []byte {
+		const wrapper = `{"name": ""}`
+		return []byte(`{"name": "` + strings.Repeat("x", n-len(wrapper)) + `"}`)
+	}
+
+	tests := []struct {
+		name     string
+		size     int
+		accepted bool
+	}{
+		{"file at the limit", maxConfigImportSize, true},
+		{"file over the limit", maxConfigImportSize + 1, false},
+		{"body over the limit", maxConfigImportSize + maxConfigImportOverhead + 1, false},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			s := newTestServer(t)
+
+			user := data.User{Username: "testuser"}
+			require.NoError(t, s.DB.Create(&user).Error)
+
+			body := &bytes.Buffer{}
+			mw := multipart.NewWriter(body)
+			part, err := mw.CreateFormFile("file", "device.json")
+			require.NoError(t, err)
+			_, err = part.Write(configOfSize(tt.size))
+			require.NoError(t, err)
+			require.NoError(t, mw.Close())
+
+			req, _ := http.NewRequest(http.MethodPost, "/devices/import", body)
+			req.Header.Set("Content-Type", mw.FormDataContentType())
+			req = req.WithContext(context.WithValue(req.Context(), userContextKey, &user))
+
+			rr := httptest.NewRecorder()
+			s.handleImportNewDeviceConfig(rr, req)
+
+			count, err := gorm.G[data.Device](s.DB).Where("username = ?", "testuser").Count(context.Background(), "*")
+			require.NoError(t, err)
+			if tt.accepted {
+				assert.NotEqual(t, http.StatusRequestEntityTooLarge, rr.Code)
+				assert.EqualValues(t, 1, count)
+			} else {
+				assert.Equal(t, http.StatusRequestEntityTooLarge, rr.Code)
+				assert.Zero(t, count)
+			}
+		})
+	}
+}
@@ -84,17 +84,56 @@ func (s *Server) autoRefreshSystemRepo() {
 	}
 }
 
+// refreshSystemRepo syncs the system apps checkout and reloads the cache.
+// The scheduled refresh and the admin handlers can overlap, and a clone or
+// pull can take a while, so calls are serialized rather than running git
+// concurrently on the same directory.
 func (s *Server) refreshSystemRepo() error {
+	s.systemRepoMutex.Lock()
+	defer s.systemRepoMutex.Unlock()
+
 	repoURL := s.Config.SystemAppsRepo
 	appsPath := filepath.Join(s.DataDir, "system-apps")
 	if err := gitutils.EnsureRepo(appsPath, repoURL, s.Config.GitHubToken, true); err != nil {
 		return err
 	}
 
+	s.systemAppsCacheMutex.Lock()
+	s.systemRepoInfo = nil
+	s.systemRepoGen++
+	s.systemAppsCacheMutex.Unlock()
+
 	s.RefreshSystemAppsCache()
 	return nil
 }
 
+// getSystemRepoInfo returns details of the system apps checkout. The checkout
+// only changes in refreshSystemRepo, so the result is kept until the next sync
+// instead of reopening the repository for every settings or addapp page.
+func (s *Server) getSystemRepoInfo() (*gitutils.RepoInfo, error) {
+	repoURL := s.Config.SystemAppsRepo
+
+	s.systemAppsCacheMutex.RLock()
+	info, gen := s.systemRepoInfo, s.systemRepoGen
+	s.systemAppsCacheMutex.RUnlock()
+	if info != nil && info.URL == repoURL {
+		return info, nil
+	}
+
+	info, err := gitutils.GetRepoInfo(filepath.Join(s.DataDir, "system-apps"), repoURL)
+	if err != nil {
+		return nil, err
+	}
+
+	// Don't overwrite the cache if a sync finished while reading.
+	s.systemAppsCacheMutex.Lock()
+	if s.systemRepoGen == gen {
+		s.systemRepoInfo = info
+	}
+	s.systemAppsCacheMutex.Unlock()
+	return info, nil
+}
+
 func (s *Server) doUpdateCheck() {
 	if !s.Config.EnableUpdateChecks {
 		return
@@ -4,6 +4,8 @@ import (
 	"net/http"
 	"net/http/httptest"
 	"testing"
+
+	"tronbyt-server/internal/gitutils"
 )
 
 func TestHandleHealth(t *testing.T) {
@@ -25,3 +27,23 @@ func TestHandleHealth(t *testing.T) {
 			rr.Body.String(), expected)
 	}
 }
+
+func TestGetSystemRepoInfoCached(t *testing.T) {
+	s := newTestServer(t)
+	s.Config.SystemAppsRepo = "https://github.com/tronbyt/apps.git"
+	s.systemRepoInfo = &gitutils.RepoInfo{URL: s.Config.SystemAppsRepo, CommitHash: "abc123"}
+
+	// There is no checkout on disk, so only a cache hit can succeed.
+	info, err := s.getSystemRepoInfo()
+	if err != nil {
+		t.Fatalf("getSystemRepoInfo() failed: %v", err)
+	}
+	if info.CommitHash != "abc123" {
+		t.Errorf("CommitHash = %q, want cached abc123", info.CommitHash)
+	}
+
+	s.Config.SystemAppsRepo = "https://github.com/example/apps.git"
+	if _, err := s.getSystemRepoInfo(); err == nil {
+		t.Error("getSystemRepoInfo() returned info cached for a different repo URL")
+	}
+}
@@ -21,8 +21,9 @@ func (s *Server) handleIndex(w http.ResponseWriter, r *http.Request) {
 	slog.Debug("handleIndex called")
 	user := GetUser(r)
 
-	targetDeviceID := r.URL.Query().Get("device_id")
-	partial := r.URL.Query().Get("partial")
+	query := r.URL.Query()
+	targetDeviceID := query.Get("device_id")
+	partial := query.Get("partial")
 
 	// Filter devices if targetDeviceID is set, otherwise use all
 	var devices []data.Device
@@ -66,12 +67,13 @@ func (s *Server) handleAdminIndex(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	// The admin page only lists each user's device count, so skip the apps
+	// and load just the device columns needed to associate and order them.
 	users, err := gorm.G[data.User](s.DB).
 		Preload("Devices", func(db gorm.PreloadBuilder) error {
-			db.Order("name ASC")
+			db.Select("id", "username", "name").Order("name ASC")
 			return nil
 		}).
-		Preload("Devices.Apps", orderedAppsPreload).
 		Find(r.Context())
 	if err != nil {
 		slog.Error("Failed to list users", "error", err)
@@ -116,13 +118,7 @@ func (s *Server) handleDeleteUser(w http.ResponseWriter, r *http.Request) {
 
 	// Clean up files
 	for _, d := range targetUser.Devices {
-		deviceWebpDir, err := s.ensureDeviceImageDir(d.ID)
-		if err != nil {
-			slog.Error("Failed to get device webp directory for deletion", "device_id", d.ID, "error", err)
-			http.Error(w, "Internal Server Error", http.StatusInternalServerError)
-			return
-		}
-		if err := os.RemoveAll(deviceWebpDir); err != nil {
+		if err := s.removeDeviceImageDir(d.ID); err != nil {
 			slog.Error("Failed to remove device webp directory", "device_id", d.ID, "error", err)
 		}
 	}
@@ -130,6 +126,7 @@ func (s *Server) handleDeleteUser(w http.ResponseWriter, r *http.Request) {
 	if err := os.RemoveAll(userAppsDir); err != nil {
 		slog.Error("Failed to remove user apps directory", "username", targetUsername, "error", err)
 	}
+	s.invalidateUserAppsCache(targetUsername)
 
 	err = s.DB.Transaction(func(tx *gorm.DB) error {
 		// 1. Delete Apps for all user's devices
@@ -243,6 +240,7 @@ func (s *Server) handleSetUserRepo(w http.ResponseWriter, r *http.Request) {
 	}
 
 	appsPath := filepath.Join(s.DataDir, "users", user.Username, "repo")
+	defer s.invalidateUserAppsCache(user.Username)
 	if repoURL == "" {
 		if err := os.RemoveAll(appsPath); err != nil {
 			slog.Error("Failed to remove user repo directory", "error", err)
@@ -265,6 +263,7 @@ func (s *Server) handleRefreshUserRepo(w http.ResponseWriter, r *http.Request) {
 
 	if user.AppRepoURL != "" {
 		appsPath := filepath.Join(s.DataDir, "users", user.Username, "repo")
+		defer s.invalidateUserAppsCache(user.Username)
 		if err := gitutils.EnsureRepo(appsPath, user.AppRepoURL, s.Config.GitHubToken, true); err != nil {
 			slog.Error("Failed to refresh user repo", "error", err)
 			s.flashAndRedirect(w, r, "Failed to refresh user repository. Check server logs.", "/settings/content", http.StatusSeeOther)
@@ -362,13 +361,7 @@ func (s *Server) handleImportUserConfig(w http.ResponseWriter, r *http.Request)
 
 	// Clean up files for all existing devices
 	for _, d := range currentUser.Devices {
-		deviceWebpDir, err := s.ensureDeviceImageDir(d.ID)
-		if err != nil {
-			slog.Error("Failed to get device webp directory for cleanup", "device_id", d.ID, "error", err)
-			s.flashAndRedirect(w, r, "Import failed: internal server error.", "/settings/admin", http.StatusSeeOther)
-			return
-		}
-		if err := os.RemoveAll(deviceWebpDir); err != nil {
+		if err := s.removeDeviceImageDir(d.ID); err != nil {
 			slog.Error("Failed to remove device webp directory", "device_id", d.ID, "error", err)
 		}
 	}
@@ -456,9 +449,7 @@ func (s *Server) handleRefreshSystemRepo(w http.ResponseWriter, r *http.Request)
 	}
 
 	if r.Header.Get("Accept") == "application/json" {
-		repoURL := s.Config.SystemAppsRepo
-		appsPath := filepath.Join(s.DataDir, "system-apps")
-		repoInfo, err := gitutils.GetRepoInfo(appsPath, repoURL)
+		repoInfo, err := s.getSystemRepoInfo()
 		if err != nil {
 			slog.Error("Failed to get repo info", "error", err)
 			http.Error(w, "Failed to get repository information", http.StatusInternalServerError)
@@ -17,6 +17,7 @@ import (
 	"regexp"
 	"strconv"
 	"strings"
+	"time"
 
 	"tronbyt-server/internal/apps"
 	"tronbyt-server/internal/config"
@@ -162,13 +163,12 @@ func (s *Server) renderTemplate(w http.ResponseWriter, r *http.Request, name str
 	tmplData.UpdateAvailable = s.UpdateAvailable
 	tmplData.LatestReleaseURL = s.LatestReleaseURL
 
-	// Get User from session if not provided in tmplData
+	// Get User from session if not provided in tmplData. Templates only read
+	// the user's own fields, so its devices and apps aren't preloaded.
 	session, _ := s.Store.Get(r, "session-name")
 	if tmplData.User == nil {
 		if username, ok := session.Values["username"].(string); ok {
 			user, err := gorm.G[data.User](s.DB).
-				Preload("Devices", nil).
-				Preload("Devices.Apps", nil).
 				Where("username = ?", username).
 				First(r.Context())
 			if err == nil {
@@ -177,12 +177,15 @@ func (s *Server) renderTemplate(w http.ResponseWriter, r *http.Request, name str
 		}
 	}
 
-	// Calculate IsAutoLoginActive
-	userCount, err := gorm.G[data.User](s.DB).Count(r.Context(), "*")
-	if err != nil {
-		slog.Error("Failed to count users for auto-login check", "error", err)
-	} else {
-		tmplData.IsAutoLoginActive = s.Config.SingleUserAutoLogin && userCount == 1
+	// Calculate IsAutoLoginActive. The user count only matters when auto-login
+	// is configured, so skip the query on every other page render.
+	if s.Config.SingleUserAutoLogin {
+		userCount, err := gorm.G[data.User](s.DB).Count(r.Context(), "*")
+		if err != nil {
+			slog.Error("Failed to count users for auto-login check", "error", err)
+		} else {
+			tmplData.IsAutoLoginActive = userCount == 1
+		}
 	}
 
 	// Get and clear flash messages
@@ -210,7 +213,7 @@ func (s *Server) renderTemplate(w http.ResponseWriter, r *http.Request, name str
 
 	// Render partial if requested
 	if tmplData.Partial != "" {
-		err = tmpl.ExecuteTemplate(w, tmplData.Partial, tmplData)
+		err := tmpl.ExecuteTemplate(w, tmplData.Partial, tmplData)
 		if err != nil {
 			slog.Error("Failed to render partial", "template", name, "partial", tmplData.Partial, "error", err)
 			http.Error(w, "Internal Server Error", http.StatusInternalServerError)
@@ -219,7 +222,7 @@ func (s *Server) renderTemplate(w http.ResponseWriter, r *http.Request, name str
 	}
 
 	// Execute pre-parsed template
-	err = tmpl.ExecuteTemplate(w, name, tmplData)
+	err := tmpl.ExecuteTemplate(w, name, tmplData)
 	if err != nil {
 		slog.Error("Failed to render template", "template", name, "error", err)
 		http.Error(w, "Internal Server Error", http.StatusInternalServerError)
@@ -300,14 +303,15 @@ func (s *Server) getColorFilterChoices() []ColorFilterOption {
 	}
 }
 
-// generateSecureToken generates a URL-safe, base64 encoded, securely random string.
-// This is used for generating API keys and device IDs.
+// generateSecureToken generates a hex encoded, securely random string of the
+// given length. This is used for generating API keys and device IDs.
 func generateSecureToken(length int) (string, error) {
-	b := make([]byte, length)
+	// Each byte yields two hex digits, so only read as many as needed.
+	b := make([]byte, (length+1)/2)
 	if _, err := rand.Read(b); err != nil {
 		return "", err
 	}
-	return hex.EncodeToString(b)[:length], nil // Take only requested length
+	return hex.EncodeToString(b)[:length], nil // Trim the extra digit for odd lengths
 }
 
 // flashAndRedirect adds a flash message and redirects to the specified URL.
@@ -449,10 +453,21 @@ func (s *Server) saveSession(w http.ResponseWriter, r *http.Request, session *se
 }
 
 // ensureDeviceImageDir is a helper to get and ensure the device webp directory exists.
+// Resolved paths are remembered, so repeated calls on the polling paths skip
+// the securejoin walk. MkdirAll still runs every time (a single stat when the
+// directory exists), so a directory removed behind the server's back is
+// recreated instead of breaking later writes.
 func (s *Server) ensureDeviceImageDir(deviceID string) (string, error) {
-	path, err := securejoin.SecureJoin(filepath.Join(s.DataDir, "webp"), deviceID)
-	if err != nil {
-		return "", fmt.Errorf("failed to securejoin path for device webp directory %s: %w", deviceID, err)
+	var path string
+	if cached, ok := s.deviceImageDirs.Load(deviceID); ok {
+		path = cached.(string)
+	} else {
+		var err error
+		path, err = securejoin.SecureJoin(filepath.Join(s.DataDir, "webp"), deviceID)
+		if err != nil {
+			return "", fmt.Errorf("failed to securejoin path for device webp directory %s: %w", deviceID, err)
+		}
+		s.deviceImageDirs.Store(deviceID, path)
 	}
 
 	if err := os.MkdirAll(path, 0755); err != nil {
@@ -461,6 +476,19 @@ func (s *Server) ensureDeviceImageDir(deviceID string) (string, error) {
 	return path, nil
 }
 
+// removeDeviceImageDir deletes the device webp directory and drops it from
+// the ensureDeviceImageDir cache, along with the device's cached previews.
+func (s *Server) removeDeviceImageDir(deviceID string) error {
+	s.deviceImageDirs.Delete(deviceID)
+	s.forgetDevicePreviews(deviceID)
+
+	path, err := securejoin.SecureJoin(filepath.Join(s.DataDir, "webp"), deviceID)
+	if err != nil {
+		return fmt.Errorf("failed to securejoin path for device webp directory %s: %w", deviceID, err)
+	}
+	return os.RemoveAll(path)
+}
+
 // ListSystemApps returns a thread-safe copy of the system apps cache.
 func (s *Server) ListSystemApps() []apps.AppMetadata {
 	s.systemAppsCacheMutex.RLock()
@@ -471,18 +499,106 @@ func (s *Server) ListSystemApps() []apps.AppMetadata {
 	return list
 }
 
-func (s *Server) RefreshSystemAppsCache() {
+// findSystemApp looks up a system app by ID in the cache.
+func (s *Server) findSystemApp(id string) (apps.AppMetadata, bool) {
+	s.systemAppsCacheMutex.RLock()
+	defer s.systemAppsCacheMutex.RUnlock()
+
+	if i, ok := s.systemAppsByID[id]; ok {
+		return s.systemAppsCache[i], true
+	}
+	return apps.AppMetadata{}, false
+}
+
+// setSystemAppsCache replaces the system apps cache and rebuilds its indexes.
+func (s *Server) setSystemAppsCache(list []apps.AppMetadata) {
+	byID := make(map[string]int, len(list))
+	byPath := make(map[string]int, len(list))
+	for i := range list {
+		// Keep the first entry on duplicates, matching a linear scan.
+		if _, ok := byID[list[i].ID]; !ok {
+			byID[list[i].ID] = i
+		}
+		if _, ok := byPath[list[i].Path]; !ok {
+			byPath[list[i].Path] = i
+		}
+	}
+
 	s.systemAppsCacheMutex.Lock()
-	defer s.systemAppsCacheMutex.Unlock()
+	s.systemAppsCache = list
+	s.systemAppsByID = byID
+	s.systemAppsByPath = byPath
+	s.systemAppsCacheMutex.Unlock()
+}
 
+func (s *Server) RefreshSystemAppsCache() {
 	slog.Info("Refreshing system apps cache")
-	apps, err := apps.ListSystemApps(s.DataDir)
-	if err == nil {
-		s.systemAppsCache = apps
-		slog.Info("System apps cache refreshed", "count", len(s.systemAppsCache))
-	} else {
+	// Scan without holding the lock so readers keep using the old list.
+	list, err := apps.ListSystemApps(s.DataDir)
+	if err != nil {
 		slog.Error("Failed to refresh system apps cache", "error", err)
+		return
+	}
+	s.setSystemAppsCache(list)
+	slog.Info("System apps cache refreshed", "count", len(list))
+}
+
+// userAppsCacheEntry holds a user's scanned custom apps together with the
+// modification times of the directories they were scanned from.
+type userAppsCacheEntry struct {
+	uploadedMtime time.Time
+	repoMtime     time.Time
+	apps          []apps.AppMetadata
+}
+
+// userAppsDirMtimes returns the modification times of a user's uploaded and
+// repo apps directories. A missing directory yields the zero time.
+func (s *Server) userAppsDirMtimes(username string) (time.Time, time.Time) {
+	var uploaded, repo time.Time
+	if info, err := os.Stat(filepath.Join(s.DataDir, "users", username, "apps")); err == nil {
+		uploaded = info.ModTime()
 	}
+	if info, err := os.Stat(filepath.Join(s.DataDir, "users", username, "repo", "apps")); err == nil {
+		repo = info.ModTime()
+	}
+	return uploaded, repo
+}
+
+// ListUserApps returns a copy of the user's custom apps. The directory scan is
+// cached and reused while the apps directories' modification times are
+// unchanged; handlers that modify app contents in place call
+// invalidateUserAppsCache.
+func (s *Server) ListUserApps(username string) []apps.AppMetadata {
+	uploadedMtime, repoMtime := s.userAppsDirMtimes(username)
+
+	s.userAppsCacheMutex.RLock()
+	entry, ok := s.userAppsCache[username]
+	s.userAppsCacheMutex.RUnlock()
+
+	if !ok || !entry.uploadedMtime.Equal(uploadedMtime) || !entry.repoMtime.Equal(repoMtime) {
+		entry = userAppsCacheEntry{
+			uploadedMtime: uploadedMtime,
+			repoMtime:     repoMtime,
+			apps:          apps.ListUserApps(s.DataDir, username),
+		}
+		s.userAppsCacheMutex.Lock()
+		if s.userAppsCache == nil {
+			s.userAppsCache = make(map[string]userAppsCacheEntry)
+		}
+		s.userAppsCache[username] = entry
+		s.userAppsCacheMutex.Unlock()
+	}
+
+	list := make([]apps.AppMetadata, len(entry.apps))
+	copy(list, entry.apps)
+	return list
+}
+
+// invalidateUserAppsCache drops the cached app list for a user.
+func (s *Server) invalidateUserAppsCache(username string) {
+	s.userAppsCacheMutex.Lock()
+	delete(s.userAppsCache, username)
+	s.userAppsCacheMutex.Unlock()
 }
 
 // getAppMetadata retrieves metadata for an app path, checking the system cache first,
@@ -496,14 +612,14 @@ func (s *Server) getAppMetadata(appPath string) *apps.AppMetadata {
 	appDir := filepath.ToSlash(filepath.Dir(appPath))
 
 	s.systemAppsCacheMutex.RLock()
-	for i := range s.systemAppsCache {
-		metaPath := s.systemAppsCache[i].Path
-		// Check for exact match (if appPath is the directory) or parent directory match (if appPath is a file)
-		if appPath == metaPath || appDir == metaPath {
-			meta := s.systemAppsCache[i]
-			appMetadata = &meta
-			break
-		}
+	// Check for exact match (if appPath is the directory) or parent directory match (if appPath is a file)
+	i, ok := s.systemAppsByPath[appPath]
+	if !ok {
+		i, ok = s.systemAppsByPath[appDir]
+	}
+	if ok {
+		meta := s.systemAppsCache[i]
+		appMetadata = &meta
 	}
 	s.systemAppsCacheMutex.RUnlock()
 
@@ -523,16 +639,14 @@ func (s *Server) getAppMetadata(appPath string) *apps.AppMetadata {
 		}
 
 		manifestPath := filepath.Join(appDir, "manifest.yaml")
-		if _, err := os.Stat(manifestPath); err == nil {
-			if data, err := os.ReadFile(manifestPath); err == nil {
-				var m apps.Manifest
-				if err := yaml.Unmarshal(data, &m); err == nil {
-					return &apps.AppMetadata{
-						Manifest: m,
-					}
-				} else {
-					slog.Debug("Failed to unmarshal manifest for fallback", "path", manifestPath, "error", err)
+		if data, err := os.ReadFile(manifestPath); err == nil {
+			var m apps.Manifest
+			if err := yaml.Unmarshal(data, &m); err == nil {
+				return &apps.AppMetadata{
+					Manifest: m,
 				}
+			} else {
+				slog.Debug("Failed to unmarshal manifest for fallback", "path", manifestPath, "error", err)
 			}
 		}
 	}
@@ -619,6 +733,8 @@ func appendKeyToURLString(rawURL string, apiKey string) string {
 	return rawURL + "?key=" + apiKey
 }
 
+var keyQueryParamRe = regexp.MustCompile(`([?&])key=[^&]*(&|$)`)
+
 // removeKeyFromURLString removes the key query parameter from a URL string.
 func removeKeyFromURLString(rawURL string) string {
 	if rawURL == "" {
@@ -629,8 +745,7 @@ func removeKeyFromURLString(rawURL string) string {
 	u, err := url.Parse(rawURL)
 	if err != nil {
 		// If parsing fails, do simple string replacement
-		re := regexp.MustCompile(`([?&])key=[^&]*(&|$)`)
-		result := re.ReplaceAllString(rawURL, "$1")
+		result := keyQueryParamRe.ReplaceAllString(rawURL, "$1")
 		result = strings.TrimSuffix(result, "?")
 		result = strings.TrimSuffix(result, "&")
 		return result
@@ -1,6 +1,12 @@
 package server
 
-import "testing"
+import (
+	"os"
+	"path/filepath"
+	"testing"
+
+	"tronbyt-server/internal/apps"
+)
 
 func TestParseTimeInput(t *testing.T) {
 	tests := []struct {
@@ -27,3 +33,112 @@ func TestParseTimeInput(t *testing.T) {
 		}
 	}
 }
+
+func TestListUserAppsCache(t *testing.T) {
+	s := newTestServer(t)
+
+	addApp := func(name string) {
+		t.Helper()
+		dir := filepath.Join(s.DataDir, "users", "testuser", "apps", name)
+		if err := os.MkdirAll(dir, 0755); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.WriteFile(filepath.Join(dir, name+".star"), []byte("def main(): pass"), 0644); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	addApp("first")
+	got := s.ListUserApps("testuser")
+	if len(got) != 1 || got[0].ID != "first" {
+		t.Fatalf("ListUserApps() = %+v, want [first]", got)
+	}
+
+	// Mutating the returned slice must not leak into the cache.
+	got[0].ID = "mutated"
+	if again := s.ListUserApps("testuser"); again[0].ID != "first" {
+		t.Errorf("cached entry was mutated: %q", again[0].ID)
+	}
+
+	addApp("second")
+	s.invalidateUserAppsCache("testuser")
+	if got := s.ListUserApps("testuser"); len(got) != 2 {
+		t.Errorf("ListUserApps() after invalidation returned %d apps, want 2", len(got))
+	}
+}
+
+func TestGenerateSecureToken(t *testing.T) {
+	for _, length := range []int{7, 8, 16, 32} {
+		token, err := generateSecureToken(length)
+		if err != nil {
+			t.Fatalf("generateSecureToken(%d) error = %v", length, err)
+		}
+		if len(token) != length {
+			t.Errorf("generateSecureToken(%d) returned %q (len %d)", length, token, len(token))
+		}
+	}
+}
+
+func TestEnsureDeviceImageDirCache(t *testing.T) {
+	s := newTestServer(t)
+
+	dir, err := s.ensureDeviceImageDir("abcd1234")
+	if err != nil {
+		t.Fatal(err)
+	}
+	if info, err := os.Stat(dir); err != nil || !info.IsDir() {
+		t.Fatalf("device image dir not created: %v", err)
+	}
+
+	if err := s.removeDeviceImageDir("abcd1234"); err != nil {
+		t.Fatal(err)
+	}
+	if _, err := os.Stat(dir); !os.IsNotExist(err) {
+		t.Fatalf("device image dir not removed: %v", err)
+	}
+
+	// The cached entry must not outlive the directory.
+	again, err := s.ensureDeviceImageDir("abcd1234")
+	if err != nil {
+		t.Fatal(err)
+	}
+	if again != dir {
+		t.Errorf("ensureDeviceImageDir() = %q, want %q", again, dir)
+	}
+	if _, err := os.Stat(dir); err != nil {
+		t.Errorf("device image dir not re-created: %v", err)
+	}
+
+	// A directory removed outside the server is re-created on the next call.
+	if err := os.RemoveAll(dir); err != nil {
+		t.Fatal(err)
+	}
+	if _, err := s.ensureDeviceImageDir("abcd1234"); err != nil {
+		t.Fatal(err)
+	}
+	if _, err := os.Stat(dir); err != nil {
+		t.Errorf("externally removed device image dir not re-created: %v", err)
+	}
+}
+
+func TestSystemAppsCacheLookups(t *testing.T) {
+	s := newTestServer(t)
+	s.setSystemAppsCache([]apps.AppMetadata{
+		{Manifest: apps.Manifest{ID: "clock", Name: "Clock"}, Path: "system-apps/apps/clock"},
+		{Manifest: apps.Manifest{ID: "weather", Name: "Weather"}, Path: "system-apps/apps/weather"},
+	})
+
+	if app, ok := s.findSystemApp("weather"); !ok || app.Name != "Weather" {
+		t.Errorf("findSystemApp(weather) = %+v, %v", app, ok)
+	}
+	if _, ok := s.findSystemApp("missing"); ok {
+		t.Error("findSystemApp(missing) found an app")
+	}
+
+	// Both the app directory and a file inside it resolve to the app.
+	for _, path := range []string{"system-apps/apps/clock", "system-apps/apps/clock/clock.star"} {
+		if meta := s.getAppMetadata(path); meta == nil || meta.ID != "clock" {
+			t.Errorf("getAppMetadata(%q) = %+v, want clock", path, meta)
+		}
+	}
+}
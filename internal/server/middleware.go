@@ -318,6 +318,16 @@ var gzipWriterPool = sync.Pool{
 	},
 }
 
+// compressibleContentTypes lists the non-text/* content types that GzipMiddleware compresses.
+var compressibleContentTypes = map[string]bool{
+	"application/json":         true,
+	"application/javascript":   true,
+	"application/x-javascript": true,
+	"application/xml":          true,
+	"application/ld+json":      true,
+	"image/svg+xml":            true,
+}
+
 // GzipMiddleware compresses HTTP responses with gzip if the client supports it.
 func GzipMiddleware(next http.Handler) http.Handler {
 	return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
@@ -372,13 +382,7 @@ func (w *gzipResponseWriter) WriteHeader(code int) {
 	}
 	contentType = strings.TrimSpace(strings.ToLower(contentType))
 
-	isCompressible := strings.HasPrefix(contentType, "text/") ||
-		contentType == "application/json" ||
-		contentType == "application/javascript" ||
-		contentType == "application/x-javascript" ||
-		contentType == "application/xml" ||
-		contentType == "application/ld+json" ||
-		contentType == "image/svg+xml"
+	isCompressible := strings.HasPrefix(contentType, "text/") || compressibleContentTypes[contentType]
 
 	if !isCompressible {
 		w.skip = true
@@ -425,6 +429,21 @@ func (w *gzipResponseWriter) Write(b []byte) (int, error) {
 	return w.gz.Write(b)
 }
 
+// ReadFrom implements io.ReaderFrom. Responses that are not compressed (e.g.
+// images and firmware served from disk) are handed to the underlying writer
+// so net/http can use sendfile instead of copying through user space.
+func (w *gzipResponseWriter) ReadFrom(src io.Reader) (int64, error) {
+	if !w.wroteHeader && w.Header().Get("Content-Type") != "" {
+		w.WriteHeader(http.StatusOK)
+	}
+	if w.wroteHeader && w.skip {
+		if rf, ok := w.ResponseWriter.(io.ReaderFrom); ok {
+			return rf.ReadFrom(src)
+		}
+	}
+	return io.Copy(writerOnly{w}, src)
+}
+
 func (w *gzipResponseWriter) Close() error {
 	if w.hijacked || w.skip {
 		return nil
@@ -465,3 +484,9 @@ func (w *gzipResponseWriter) Push(target string, opts *http.PushOptions) error {
 	}
 	return p.Push(target, opts)
 }
+
+// writerOnly hides any io.ReaderFrom implementation of the wrapped writer so
+// io.Copy falls back to plain Write calls.
+type writerOnly struct {
+	io.Writer
+}
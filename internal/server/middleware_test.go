@@ -2,8 +2,10 @@ package server
 
 import (
 	"bytes"
+	"io"
 	"net/http"
 	"net/http/httptest"
+	"strings"
 	"testing"
 )
 
@@ -171,4 +173,47 @@ func TestGzipMiddleware(t *testing.T) {
 			t.Errorf("Expected plain body 'Hello', got %q", rr.Body.String())
 		}
 	})
+	t.Run("ReadFrom passes through uncompressed content", func(t *testing.T) {
+		handler := GzipMiddleware(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+			w.Header().Set("Content-Type", "image/webp")
+			rf, ok := w.(io.ReaderFrom)
+			if !ok {
+				t.Fatal("expected gzip writer to implement io.ReaderFrom")
+			}
+			_, _ = rf.ReadFrom(strings.NewReader("fake webp data"))
+		}))
+
+		req := httptest.NewRequest(http.MethodGet, "/", nil)
+		req.Header.Set("Accept-Encoding", "gzip")
+		rr := httptest.NewRecorder()
+
+		handler.ServeHTTP(rr, req)
+
+		if rr.Header().Get("Content-Encoding") != "" {
+			t.Errorf("Expected no Content-Encoding for image, got %v", rr.Header().Get("Content-Encoding"))
+		}
+		if rr.Body.String() != "fake webp data" {
+			t.Errorf("Expected plain body, got %q", rr.Body.String())
+		}
+	})
+
+	t.Run("ReadFrom compresses text content", func(t *testing.T) {
+		handler := GzipMiddleware(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+			w.Header().Set("Content-Type", "text/plain")
+			_, _ = io.Copy(w, strings.NewReader("Hello World"))
+		}))
+
+		req := httptest.NewRequest(http.MethodGet, "/", nil)
+		req.Header.Set("Accept-Encoding", "gzip")
+		rr := httptest.NewRecorder()
+
+		handler.ServeHTTP(rr, req)
+
+		if rr.Header().Get("Content-Encoding") != "gzip" {
+			t.Errorf("Expected gzip Content-Encoding, got %v", rr.Header().Get("Content-Encoding"))
+		}
+		if !bytes.HasPrefix(rr.Body.Bytes(), []byte{0x1f, 0x8b}) {
+			t.Error("expected gzipped body, got plain text")
+		}
+	})
 }
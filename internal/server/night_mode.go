@@ -5,12 +5,13 @@ import (
 	"time"
 
 	"tronbyt-server/internal/data"
+	"tronbyt-server/internal/tzcache"
 )
 
 func deviceTimeNow(device *data.Device) time.Time {
 	loc := time.Local
 	if tz := device.GetTimezone(); tz != "" {
-		if loaded, err := time.LoadLocation(tz); err == nil {
+		if loaded, err := tzcache.LoadLocation(tz); err == nil {
 			loc = loaded
 		}
 	}
@@ -139,10 +139,11 @@ func (s *Server) handleOIDCCallback(w http.ResponseWriter, r *http.Request) {
 	localizer := s.getLocalizer(r)
 
 	slog.Info("OIDC callback received", "path", r.URL.Path, "query", r.URL.RawQuery)
+	query := r.URL.Query()
 
 	// Check for error from provider
-	if errMsg := r.URL.Query().Get("error"); errMsg != "" {
-		slog.Warn("OIDC provider returned error", "error", errMsg, "desc", r.URL.Query().Get("error_description"))
+	if errMsg := query.Get("error"); errMsg != "" {
+		slog.Warn("OIDC provider returned error", "error", errMsg, "desc", query.Get("error_description"))
 		s.renderTemplate(w, r, "login", TemplateData{
 			Flashes: []string{localizer.MustLocalize(&i18n.LocalizeConfig{MessageID: "OIDCErrorAuth"})},
 		})
@@ -177,7 +178,7 @@ func (s *Server) handleOIDCCallback(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	actualState := r.URL.Query().Get("state")
+	actualState := query.Get("state")
 	if actualState != expectedState {
 		slog.Warn("OIDC state mismatch", "expected", expectedState, "actual", actualState)
 		s.renderTemplate(w, r, "login", TemplateData{
@@ -196,7 +197,7 @@ func (s *Server) handleOIDCCallback(w http.ResponseWriter, r *http.Request) {
 	delete(session.Values, "oidc_nonce")
 
 	// Get code
-	code := r.URL.Query().Get("code")
+	code := query.Get("code")
 	if code == "" {
 		slog.Warn("OIDC callback missing code")
 		s.renderTemplate(w, r, "login", TemplateData{
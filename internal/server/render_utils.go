@@ -1,14 +1,20 @@
 package server
 
 import (
+	"bytes"
 	"context"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
 	"fmt"
 	"io"
+	"io/fs"
 	"log/slog"
 	"maps"
 	"net/http"
 	"os"
 	"strings"
+	"sync"
 	"time"
 
 	"tronbyt-server/internal/data"
@@ -76,6 +82,16 @@ func (s *Server) RenderApp(ctx context.Context, device *data.Device, app *data.A
 		return content, nil, nil
 	}
 
+	// Renders are CPU-bound. Polls, previews and uploads can all trigger one,
+	// so cap how many run at once instead of letting them oversubscribe the
+	// CPU; callers that give up while waiting don't render at all.
+	select {
+	case s.renderLimit <- struct{}{}:
+	case <-ctx.Done():
+		return nil, nil, ctx.Err()
+	}
+	defer func() { <-s.renderLimit }()
+
 	return renderer.Render(
 		ctx,
 		appPath,
@@ -105,121 +121,272 @@ func (s *Server) possiblyRender(ctx context.Context, app *data.App, device *data
 		return false
 	}
 
+	// Starlark apps that aren't due yet need no path resolution or directory
+	// creation; this is the common case on every rotation step.
+	isStatic := strings.HasSuffix(strings.ToLower(*app.Path), ".webp")
+	// uinterval is minutes
+	if !isStatic && time.Since(app.LastRender) <= time.Duration(app.UInterval)*time.Minute {
+		return true // Not time to render yet, assume existing is fine
+	}
+
 	appPath, err := securejoin.SecureJoin(s.DataDir, *app.Path)
 	if err != nil {
 		slog.Error("Failed to resolve app path", "path", *app.Path, "error", err)
 		return false
 	}
-	appBasename := fmt.Sprintf("%s-%s", app.Name, app.Iname)
+	appBasename := app.Name + "-" + app.Iname
 	webpDir, err := s.ensureDeviceImageDir(device.ID)
 	if err != nil {
 		slog.Error("Failed to get device webp directory for rendering", "device_id", device.ID, "error", err)
 		return false
 	}
-	webpPath, err := securejoin.SecureJoin(webpDir, fmt.Sprintf("%s.webp", appBasename))
+	webpPath, err := securejoin.SecureJoin(webpDir, appWebpName(app))
 	if err != nil {
 		slog.Error("Path traversal attempt in webp path", "app", appBasename, "error", err)
 		return false
 	}
 
 	// 2. Static WebP App
-	if strings.HasSuffix(strings.ToLower(*app.Path), ".webp") {
+	if isStatic {
 		if _, err := os.Stat(webpPath); os.IsNotExist(err) {
-			// Copy from source
-			if _, err := os.Stat(appPath); err == nil {
-				if err := copyFile(appPath, webpPath); err != nil {
+			// Copy from source; opening it doubles as the existence check
+			if err := copyFile(appPath, webpPath); err != nil {
+				if os.IsNotExist(err) {
+					slog.Warn("Source WebP not found", "path", appPath)
+				} else {
 					slog.Error("Failed to copy static webp file", "src", appPath, "dst", webpPath, "error", err)
-					return false
 				}
-			} else {
-				slog.Warn("Source WebP not found", "path", appPath)
 				return false
 			}
 		}
 		return true // Exists
 	}
 
-	// 3. Starlark App - Check Interval
+	// 3. Starlark App (due for a render, checked above)
 	now := time.Now()
-	// uinterval is minutes
-	if time.Since(app.LastRender) > time.Duration(app.UInterval)*time.Minute {
-		slog.Info("Rendering app", "app", appBasename)
+	slog.Info("Rendering app", "app", appBasename)
 
-		startTime := time.Now()
-		imgBytes, messages, err := s.RenderApp(ctx, device, app, appPath, nil)
-		renderDur := time.Since(startTime)
+	startTime := time.Now()
+	imgBytes, messages, err := s.RenderApp(ctx, device, app, appPath, nil)
+	renderDur := time.Since(startTime)
 
-		for _, msg := range messages {
-			slog.Debug("Render message", "app", appBasename, "message", msg)
-		}
+	for _, msg := range messages {
+		slog.Debug("Render message", "app", appBasename, "message", msg)
+	}
 
-		empty := len(imgBytes) == 0
-		success := err == nil && !empty
-
-		s.metrics.renderDuration.Observe(renderDur.Seconds())
-		switch {
-		case err != nil:
-			s.metrics.renderTotal.WithLabelValues("error").Inc()
-			slog.Error("Error rendering app", "app", appBasename, "error", err)
-		case empty:
-			s.metrics.renderTotal.WithLabelValues("empty").Inc()
-			slog.Debug("No output from app", "app", appBasename)
-		default:
-			s.metrics.renderTotal.WithLabelValues("success").Inc()
-		}
+	empty := len(imgBytes) == 0
+	success := err == nil && !empty
 
-		// Update App State in DB - This is our atomic check-and-update.
-		// If the app was deleted while we were rendering, RowsAffected will be 0.
-		appUpdates := data.App{
-			LastRender:      now,
-			LastRenderDur:   renderDur,
-			EmptyLastRender: !success,
-			RenderMessages:  data.StringSlice(messages),
-		}
+	s.metrics.renderDuration.Observe(renderDur.Seconds())
+	switch {
+	case err != nil:
+		s.metrics.renderTotal.WithLabelValues("error").Inc()
+		slog.Error("Error rendering app", "app", appBasename, "error", err)
+	case empty:
+		s.metrics.renderTotal.WithLabelValues("empty").Inc()
+		slog.Debug("No output from app", "app", appBasename)
+	default:
+		s.metrics.renderTotal.WithLabelValues("success").Inc()
+	}
 
-		q := gorm.G[data.App](s.DB).Where("id = ?", app.ID)
-		if success {
-			appUpdates.LastSuccessfulRender = &now
-			q = q.Select("LastRender", "LastRenderDur", "EmptyLastRender", "RenderMessages", "LastSuccessfulRender")
-		} else {
-			q = q.Select("LastRender", "LastRenderDur", "EmptyLastRender", "RenderMessages")
-		}
+	// Update App State in DB - This is our atomic check-and-update.
+	// If the app was deleted while we were rendering, RowsAffected will be 0.
+	appUpdates := data.App{
+		LastRender:      now,
+		LastRenderDur:   renderDur,
+		EmptyLastRender: !success,
+		RenderMessages:  data.StringSlice(messages),
+	}
 
-		rowsAffected, err := q.Updates(ctx, appUpdates)
-		if err != nil {
-			slog.Error("Failed to update app state in DB", "app", appBasename, "error", err)
-			return false
-		}
+	q := gorm.G[data.App](s.DB).Where("id = ?", app.ID)
+	if success {
+		appUpdates.LastSuccessfulRender = &now
+		q = q.Select("LastRender", "LastRenderDur", "EmptyLastRender", "RenderMessages", "LastSuccessfulRender")
+	} else {
+		q = q.Select("LastRender", "LastRenderDur", "EmptyLastRender", "RenderMessages")
+	}
 
-		if rowsAffected == 0 {
-			slog.Info("App no longer exists in DB, aborting", "app", appBasename)
-			return false
+	rowsAffected, err := q.Updates(ctx, appUpdates)
+	if err != nil {
+		slog.Error("Failed to update app state in DB", "app", appBasename, "error", err)
+		return false
+	}
+
+	if rowsAffected == 0 {
+		slog.Info("App no longer exists in DB, aborting", "app", appBasename)
+		return false
+	}
+
+	if success {
+		// Save WebP
+		if err := os.WriteFile(webpPath, imgBytes, 0644); err != nil {
+			slog.Error("Failed to write webp", "path", webpPath, "error", err)
 		}
+	}
 
-		if success {
-			// Save WebP
-			if err := os.WriteFile(webpPath, imgBytes, 0644); err != nil {
-				slog.Error("Failed to write webp", "path", webpPath, "error", err)
-			}
+	// Update in-memory object (passed pointer)
+	app.LastRender = now
+	if success {
+		app.LastSuccessfulRender = &now
+	}
+	app.LastRenderDur = renderDur
+	app.EmptyLastRender = !success
+	app.RenderMessages = messages
+
+	// Handle Autopin
+	if app.AutoPin {
+		s.handleAutoPin(ctx, app, device, user, success)
+	}
+	return success
+}
+
+// previewCacheTTL bounds how long a config preview render is reused. The
+// config editor pushes a preview to the device and then requests the same
+// config again for the on-page image; the second request reuses the first
+// render within this window.
+const previewCacheTTL = 30 * time.Second
+
+type previewCacheEntry struct {
+	configHash string
+	image      []byte
+	renderedAt time.Time
+}
+
+// previewConfigHash returns a stable hash of a preview config. json.Marshal
+// sorts map keys, so equal configs hash equally.
+func previewConfigHash(config map[string]any) (string, error) {
+	b, err := json.Marshal(config)
+	if err != nil {
+		return "", err
+	}
+	sum := sha256.Sum256(b)
+	return hex.EncodeToString(sum[:16]), nil
+}
+
+// cachedPreview returns the preview rendered for the installation with the
+// given config hash, if it is still fresh.
+func (s *Server) cachedPreview(deviceID, iname, configHash string) ([]byte, bool) {
+	key := deviceID + "/" + iname
+	v, ok := s.previewCache.Load(key)
+	if !ok {
+		return nil, false
+	}
+	entry := v.(*previewCacheEntry)
+	if time.Since(entry.renderedAt) > previewCacheTTL {
+		s.previewCache.CompareAndDelete(key, v)
+		return nil, false
+	}
+	if entry.configHash != configHash {
+		return nil, false
+	}
+	return entry.image, true
+}
+
+// storePreview remembers a config preview render for cachedPreview. Expired
+// renders are swept at the same time, so installations that are previewed
+// once and never again don't keep their images in memory.
+func (s *Server) storePreview(deviceID, iname, configHash string, image []byte) {
+	now := time.Now()
+	s.previewCache.Range(func(key, v any) bool {
+		if now.Sub(v.(*previewCacheEntry).renderedAt) > previewCacheTTL {
+			s.previewCache.CompareAndDelete(key, v)
 		}
+		return true
+	})
+	s.previewCache.Store(deviceID+"/"+iname, &previewCacheEntry{
+		configHash: configHash,
+		image:      image,
+		renderedAt: now,
+	})
+}
+
+// forgetPreview drops the cached preview of a deleted installation.
+func (s *Server) forgetPreview(deviceID, iname string) {
+	s.previewCache.Delete(deviceID + "/" + iname)
+}
 
-		// Update in-memory object (passed pointer)
-		app.LastRender = now
-		if success {
-			app.LastSuccessfulRender = &now
+// forgetDevicePreviews drops the cached previews of every installation on a
+// device.
+func (s *Server) forgetDevicePreviews(deviceID string) {
+	prefix := deviceID + "/"
+	s.previewCache.Range(func(key, _ any) bool {
+		if strings.HasPrefix(key.(string), prefix) {
+			s.previewCache.Delete(key)
 		}
-		app.LastRenderDur = renderDur
-		app.EmptyLastRender = !success
-		app.RenderMessages = messages
+		return true
+	})
+}
 
-		// Handle Autopin
-		if app.AutoPin {
-			s.handleAutoPin(ctx, app, device, user, success)
+// serveWebpFile streams the webp at path. It reports false without writing
+// anything if the file can't be opened, so callers can fall back to another
+// image. Opening directly avoids a separate existence check before serving.
+func serveWebpFile(w http.ResponseWriter, r *http.Request, path string) bool {
+	f, err := os.Open(path)
+	if err != nil {
+		return false
+	}
+	defer func() {
+		if err := f.Close(); err != nil {
+			slog.Error("Failed to close webp file", "path", path, "error", err)
 		}
-		return success
+	}()
+
+	info, err := f.Stat()
+	if err != nil || info.IsDir() {
+		return false
 	}
 
-	return true // Not time to render yet, assume existing is fine
+	w.Header().Set("Content-Type", "image/webp")
+	w.Header().Set("ETag", webpETag(info))
+	http.ServeContent(w, r, info.Name(), info.ModTime(), f)
+	return true
+}
+
+// webpETag derives a validator from the file's size and nanosecond mtime.
+// Last-Modified only has one-second resolution, which misses re-renders that
+// land within the same second; with an ETag, ServeContent answers
+// If-None-Match exactly.
+func webpETag(info fs.FileInfo) string {
+	return fmt.Sprintf(`"%x-%x"`, info.Size(), info.ModTime().UnixNano())
+}
+
+// pendingRender is a render queued by renderInBackground.
+type pendingRender struct {
+	app    data.App
+	device data.Device
+	user   data.User
+}
+
+// renderInBackground queues a render of app for handlers whose response does
+// not depend on the result, such as saving an app's configuration. Requests
+// for an installation that is still queued replace the queued snapshot rather
+// than adding another render, so the latest config is what gets rendered.
+func (s *Server) renderInBackground(ctx context.Context, app *data.App, device *data.Device, user *data.User) {
+	key := device.ID + "/" + app.Iname
+	if _, queued := s.pendingRenders.Swap(key, &pendingRender{app: *app, device: *device, user: *user}); queued {
+		return
+	}
+
+	ctx = context.WithoutCancel(ctx)
+
+	s.backgroundRender.Add(1)
+	go func() {
+		defer s.backgroundRender.Done()
+
+		// Wait for a background slot before taking the snapshot, so renders
+		// queued behind it keep coalescing.
+		s.backgroundSlots <- struct{}{}
+		defer func() { <-s.backgroundSlots }()
+
+		v, ok := s.pendingRenders.LoadAndDelete(key)
+		if !ok {
+			return
+		}
+		job := v.(*pendingRender)
+		if s.possiblyRender(ctx, &job.app, &job.device, &job.user) {
+			s.notifyDashboard(job.user.Username, WSEvent{Type: "apps_changed", DeviceID: job.device.ID})
+		}
+	}()
 }
 
 func (s *Server) handleAutoPin(ctx context.Context, app *data.App, device *data.Device, user *data.User, success bool) {
@@ -309,24 +476,20 @@ func copyFile(src, dst string) error {
 	return err
 }
 
+// defaultImage returns the embedded fallback image. It is read once and
+// shared; callers must not modify the returned slice.
+var defaultImage = sync.OnceValues(func() ([]byte, error) {
+	return web.Assets.ReadFile("static/images/default.webp")
+})
+
 func (s *Server) sendDefaultImage(w http.ResponseWriter, r *http.Request, device *data.Device) {
 	// Fallback if main image retrieval fails
-	path := "static/images/default.webp"
-
-	// Get default image from embedded assets
-	f, err := web.Assets.Open(path)
+	img, err := defaultImage()
 	if err != nil {
-		slog.Error("Failed to open default image from assets", "error", err)
+		slog.Error("Failed to read default image from assets", "error", err)
 		http.Error(w, "Image not found", http.StatusNotFound)
 		return
 	}
-	defer func() {
-		if err := f.Close(); err != nil {
-			slog.Error("Failed to close default image file", "error", err)
-		}
-	}()
-
-	stat, _ := f.Stat()
 
 	// Headers
 	w.Header().Set("Content-Type", "image/webp")
@@ -338,10 +501,6 @@ func (s *Server) sendDefaultImage(w http.ResponseWriter, r *http.Request, device
 	dwell := device.DefaultInterval
 	w.Header().Set("Tronbyt-Dwell-Secs", fmt.Sprintf("%d", dwell))
 
-	if rs, ok := f.(io.ReadSeeker); ok {
-		http.ServeContent(w, r, "default.webp", stat.ModTime(), rs)
-	} else {
-		slog.Error("Embedded file does not implement ReadSeeker")
-		http.Error(w, "Internal Server Error", http.StatusInternalServerError)
-	}
+	// Embedded files carry no modification time, so pass the zero time.
+	http.ServeContent(w, r, "default.webp", time.Time{}, bytes.NewReader(img))
 }
@@ -0,0 +1,151 @@
+package server
+
+import (
+	"context"
+	"net/http"
+	"net/http/httptest"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"tronbyt-server/internal/data"
+)
+
+func TestRenderInBackgroundCoalescesQueuedRenders(t *testing.T) {
+	s := newTestServer(t)
+	user := data.User{Username: "testuser"}
+	device := data.Device{ID: "testdevice", Username: "testuser"}
+
+	// Hold every background slot so queued renders can't start yet.
+	for range cap(s.backgroundSlots) {
+		s.backgroundSlots <- struct{}{}
+	}
+
+	first := data.App{Iname: "100", Notes: "first"}
+	second := data.App{Iname: "100", Notes: "second"}
+	s.renderInBackground(context.Background(), &first, &device, &user)
+	s.renderInBackground(context.Background(), &second, &device, &user)
+
+	v, ok := s.pendingRenders.Load("testdevice/100")
+	if !ok {
+		t.Fatal("expected a pending render")
+	}
+	if got := v.(*pendingRender).app.Notes; got != "second" {
+		t.Errorf("pending render uses %q, want the latest snapshot", got)
+	}
+
+	for range cap(s.backgroundSlots) {
+		<-s.backgroundSlots
+	}
+	s.backgroundRender.Wait()
+
+	if _, ok := s.pendingRenders.Load("testdevice/100"); ok {
+		t.Error("pending render was not consumed")
+	}
+}
+
+func TestRenderAppGivesUpWaitingForLimit(t *testing.T) {
+	s := newTestServer(t)
+	for range cap(s.renderLimit) {
+		s.renderLimit <- struct{}{}
+	}
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+	if _, _, err := s.RenderApp(ctx, nil, nil, "app.star", nil); err != context.Canceled {
+		t.Errorf("RenderApp() error = %v, want context.Canceled while all render slots are taken", err)
+	}
+}
+
+func TestServeWebpFile(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "app.webp")
+	if err := os.WriteFile(path, []byte("RIFFwebp"), 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	req := httptest.NewRequest(http.MethodGet, "/preview", nil)
+	rr := httptest.NewRecorder()
+	if !serveWebpFile(rr, req, path) {
+		t.Fatal("serveWebpFile() = false for an existing file")
+	}
+	if ct := rr.Header().Get("Content-Type"); ct != "image/webp" {
+		t.Errorf("Content-Type = %q, want image/webp", ct)
+	}
+	if rr.Header().Get("Content-Length") != "8" || rr.Body.String() != "RIFFwebp" {
+		t.Errorf("unexpected response: %q (Content-Length %q)", rr.Body.String(), rr.Header().Get("Content-Length"))
+	}
+
+	etag := rr.Header().Get("ETag")
+	if etag == "" {
+		t.Fatal("serveWebpFile() did not set an ETag")
+	}
+	req = httptest.NewRequest(http.MethodGet, "/preview", nil)
+	req.Header.Set("If-None-Match", etag)
+	rr = httptest.NewRecorder()
+	serveWebpFile(rr, req, path)
+	if rr.Code != http.StatusNotModified || rr.Body.Len() != 0 {
+		t.Errorf("revalidation got %d with %d bytes, want empty 304", rr.Code, rr.Body.Len())
+	}
+
+	rr = httptest.NewRecorder()
+	if serveWebpFile(rr, req, filepath.Join(filepath.Dir(path), "missing.webp")) {
+		t.Error("serveWebpFile() = true for a missing file")
+	}
+	if rr.Body.Len() != 0 {
+		t.Error("serveWebpFile() wrote a body for a missing file")
+	}
+}
+
+func TestPreviewCache(t *testing.T) {
+	s := newTestServer(t)
+
+	a, err := previewConfigHash(map[string]any{"location": "home", "units": "metric"})
+	if err != nil {
+		t.Fatal(err)
+	}
+	b, _ := previewConfigHash(map[string]any{"units": "metric", "location": "home"})
+	if a != b {
+		t.Errorf("hash depends on key order: %s != %s", a, b)
+	}
+	other, _ := previewConfigHash(map[string]any{"units": "imperial", "location": "home"})
+
+	s.storePreview("dev", "100", a, []byte("img"))
+	if img, ok := s.cachedPreview("dev", "100", a); !ok || string(img) != "img" {
+		t.Errorf("cachedPreview() = %q, %v; want cached image", img, ok)
+	}
+	if _, ok := s.cachedPreview("dev", "100", other); ok {
+		t.Error("cachedPreview() hit for a different config")
+	}
+	if _, ok := s.cachedPreview("dev", "101", a); ok {
+		t.Error("cachedPreview() hit for a different installation")
+	}
+
+	v, _ := s.previewCache.Load("dev/100")
+	v.(*previewCacheEntry).renderedAt = time.Now().Add(-2 * previewCacheTTL)
+	if _, ok := s.cachedPreview("dev", "100", a); ok {
+		t.Error("cachedPreview() returned an expired render")
+	}
+
+	s.storePreview("dev", "100", a, []byte("img"))
+	v, _ = s.previewCache.Load("dev/100")
+	v.(*previewCacheEntry).renderedAt = time.Now().Add(-2 * previewCacheTTL)
+	s.storePreview("dev", "101", a, []byte("img"))
+	if _, ok := s.previewCache.Load("dev/100"); ok {
+		t.Error("storePreview() kept an expired render of another installation")
+	}
+
+	s.storePreview("dev", "102", a, []byte("img"))
+	s.storePreview("other", "100", a, []byte("img"))
+	s.forgetPreview("dev", "101")
+	if _, ok := s.cachedPreview("dev", "101", a); ok {
+		t.Error("forgetPreview() kept the deleted installation")
+	}
+	s.forgetDevicePreviews("dev")
+	if _, ok := s.cachedPreview("dev", "102", a); ok {
+		t.Error("forgetDevicePreviews() kept an installation of the deleted device")
+	}
+	if _, ok := s.cachedPreview("other", "100", a); !ok {
+		t.Error("forgetDevicePreviews() dropped another device's preview")
+	}
+}
@@ -1,18 +1,18 @@
 package server
 
 import (
+	"cmp"
 	"context"
+	"errors"
 	"fmt"
 	"log/slog"
 	"os"
 	"path/filepath"
 	"slices"
-	"sort"
 	"strings"
 	"time"
 
 	"tronbyt-server/internal/data"
-	"tronbyt-server/web"
 
 	securejoin "github.com/cyphar/filepath-securejoin"
 	"gorm.io/gorm"
@@ -22,42 +22,39 @@ func (s *Server) GetNextAppImage(ctx context.Context, device *data.Device, user
 	// 1. Check Pushed Ephemeral Images (__*)
 	// Serve the oldest and delete only that one. Anonymous pushes accumulate
 	// unbounded; callers should use coalesceID to limit queue depth.
-	pushedDir := filepath.Join(s.DataDir, "webp", device.ID, "pushed")
-	if entries, err := os.ReadDir(pushedDir); err == nil {
-		var ephemeral []os.DirEntry
-		for _, entry := range entries {
-			if strings.HasPrefix(entry.Name(), "__") && strings.HasSuffix(entry.Name(), ".webp") && !entry.IsDir() {
-				ephemeral = append(ephemeral, entry)
-			}
-		}
-		if len(ephemeral) > 0 {
-			// Sort ascending by name (lower timestamp = older)
-			sort.Slice(ephemeral, func(i, j int) bool {
-				return ephemeral[i].Name() < ephemeral[j].Name()
-			})
-
-			for _, entry := range ephemeral {
-				entryPath := filepath.Join(pushedDir, entry.Name())
-				imgData, err := os.ReadFile(entryPath)
-				if err == nil {
-					// Delete only the one served; coalesceID handles dedup at write time
-					if err := os.Remove(entryPath); err != nil {
-						slog.Warn("Failed to remove ephemeral image", "path", entryPath, "error", err)
-					}
-					return imgData, nil, nil
-				}
-				// If reading failed, clean it up and try the next one
-				slog.Warn("Failed to read ephemeral image, cleaning up", "path", entryPath, "error", err)
+	// The device directory is resolved once and reused for the final image path.
+	deviceWebpDir, dirErr := s.ensureDeviceImageDir(device.ID)
+	if dirErr != nil {
+		slog.Error("Failed to get device webp directory for next app image", "device_id", device.ID, "error", dirErr)
+	}
+	var ephemeral []string
+	pushedDir := filepath.Join(deviceWebpDir, "pushed")
+	if dirErr == nil {
+		ephemeral = listEphemeralImages(pushedDir)
+	}
+	if len(ephemeral) > 0 {
+		// Names are sorted ascending (lower timestamp = older)
+		for _, name := range ephemeral {
+			entryPath := filepath.Join(pushedDir, name)
+			imgData, err := os.ReadFile(entryPath)
+			if err == nil {
+				// Delete only the one served; coalesceID handles dedup at write time
 				if err := os.Remove(entryPath); err != nil {
-					slog.Warn("Failed to remove broken ephemeral image", "path", entryPath, "error", err)
+					slog.Warn("Failed to remove ephemeral image", "path", entryPath, "error", err)
 				}
+				return imgData, nil, nil
+			}
+			// If reading failed, clean it up and try the next one
+			slog.Warn("Failed to read ephemeral image, cleaning up", "path", entryPath, "error", err)
+			if err := os.Remove(entryPath); err != nil {
+				slog.Warn("Failed to remove broken ephemeral image", "path", entryPath, "error", err)
 			}
 		}
 	}
 
 	// Helper to return default image
 	getDefaultImage := func() ([]byte, *data.App, error) {
-		data, err := web.Assets.ReadFile("static/images/default.webp")
+		data, err := defaultImage()
 		if err != nil {
 			return nil, nil, fmt.Errorf("failed to read default image: %w", err)
 		}
@@ -115,15 +112,11 @@ func (s *Server) GetNextAppImage(ctx context.Context, device *data.Device, user
 	}
 
 	// 6. Return Image
-	var webpPath string
-
-	deviceWebpDir, err := s.ensureDeviceImageDir(device.ID)
-	if err != nil {
-		slog.Error("Failed to get device webp directory for next app image", "device_id", device.ID, "error", err)
+	if dirErr != nil {
 		return getDefaultImage()
 	}
 
-	webpPath = s.getAppWebpPath(deviceWebpDir, app)
+	webpPath := s.getAppWebpPath(deviceWebpDir, app)
 
 	data, err := os.ReadFile(webpPath)
 	// If reading the specific app image fails, fall back to default
@@ -134,15 +127,25 @@ func (s *Server) GetNextAppImage(ctx context.Context, device *data.Device, user
 	return data, app, err
 }
 
-func (s *Server) GetCurrentAppImage(ctx context.Context, device *data.Device) ([]byte, *data.App, error) {
+// OpenCurrentAppImage opens the image file of the app currently shown on the
+// device. The caller must close the returned file. Returning the open file
+// rather than its contents lets handlers stream it to the client.
+func (s *Server) OpenCurrentAppImage(ctx context.Context, device *data.Device) (*os.File, *data.App, error) {
 	// Re-fetch device with Apps if missing
 	if len(device.Apps) == 0 {
-		reloaded, err := gorm.G[data.Device](s.DB).Preload("Apps", nil).Where("id = ?", device.ID).First(ctx)
+		reloaded, err := gorm.G[data.Device](s.DB).Preload("Apps", orderedAppsPreload).Where("id = ?", device.ID).First(ctx)
 		if err == nil {
 			*device = reloaded
 		}
 	}
 
+	// Both lookups below build paths in the same directory, so resolve it once.
+	deviceWebpDir, err := s.ensureDeviceImageDir(device.ID)
+	if err != nil {
+		slog.Error("Failed to get device webp directory for current app image", "device_id", device.ID, "error", err)
+		return nil, nil, fmt.Errorf("failed to get device webp directory: %w", err)
+	}
+
 	// Priority 1: Check DisplayingApp (Real-time confirmation from WS devices)
 	if device.DisplayingApp != nil && *device.DisplayingApp != "" {
 		targetIname := *device.DisplayingApp
@@ -152,31 +155,21 @@ func (s *Server) GetCurrentAppImage(ctx context.Context, device *data.Device) ([
 			if device.Apps[i].Iname == targetIname {
 				app := device.Apps[i]
 
-				// Generate path
-				deviceWebpDir, err := s.ensureDeviceImageDir(device.ID)
-				if err != nil {
-					slog.Warn("Failed to get device webp directory", "device_id", device.ID, "error", err)
-					break
-				}
 				webpPath := s.getAppWebpPath(deviceWebpDir, app)
 
-				// Check if file exists to be safe
-				if _, err := os.Stat(webpPath); err == nil {
-					data, err := os.ReadFile(webpPath)
-					return data, app, err
-				} else {
-					slog.Warn("DisplayingApp file missing, falling back", "path", webpPath)
+				// Opening the file doubles as the existence check
+				f, err := os.Open(webpPath)
+				if err == nil {
+					return f, app, nil
 				}
+				slog.Warn("DisplayingApp file missing, falling back", "path", webpPath, "error", err)
 				break // Valid app but missing file, fallthrough to legacy logic
 			}
 		}
 	}
 
 	// Priority 2: Fallback to LastAppIndex (Legacy/HTTP devices)
-	apps := slices.Clone(device.Apps)
-	sort.Slice(apps, func(i, j int) bool {
-		return apps[i].Order < apps[j].Order
-	})
+	apps := appsInOrder(device.Apps)
 	expanded := createExpandedAppsList(device, apps)
 
 	if len(expanded) == 0 {
@@ -191,23 +184,22 @@ func (s *Server) GetCurrentAppImage(ctx context.Context, device *data.Device) ([
 	app := expanded[idx]
 
 	// Return image
-	var webpPath string
+	webpPath := s.getAppWebpPath(deviceWebpDir, app)
 
-	deviceWebpDir, err := s.ensureDeviceImageDir(device.ID)
+	f, err := os.Open(webpPath)
 	if err != nil {
-		slog.Error("Failed to get device webp directory for current app image", "device_id", device.ID, "error", err)
-		return nil, nil, fmt.Errorf("failed to get device webp directory: %w", err)
+		return nil, nil, err
 	}
-
-	webpPath = s.getAppWebpPath(deviceWebpDir, app)
-
-	data, err := os.ReadFile(webpPath)
-	return data, app, err
+	return f, app, nil
 }
 
 func (s *Server) determineNextApp(ctx context.Context, device *data.Device, user *data.User) (*data.App, int, error) {
+	// Resolve the device clock once; it is shared by the night mode check and
+	// every schedule evaluation below.
+	now := deviceScheduleTime(device)
+
 	// 1. Night Mode Logic (Highest Priority)
-	nightModeActive := device.GetNightModeIsActive()
+	nightModeActive := device.GetNightModeIsActiveAt(now)
 	if nightModeActive && device.NightModeApp != "" {
 		nightIname := device.NightModeApp
 		for i := range device.Apps {
@@ -261,11 +253,14 @@ func (s *Server) determineNextApp(ctx context.Context, device *data.Device, user
 		}
 	}
 
+	// Regular rotation (interstitials included) only shows enabled apps, so
+	// a device with none enabled can skip building and scanning the rotation.
+	if !slices.ContainsFunc(device.Apps, func(app *data.App) bool { return app.Enabled }) {
+		return nil, 0, nil
+	}
+
 	// Sort Apps
-	apps := slices.Clone(device.Apps)
-	sort.Slice(apps, func(i, j int) bool {
-		return apps[i].Order < apps[j].Order
-	})
+	apps := appsInOrder(device.Apps)
 
 	// Create Expanded List (with Interstitials)
 	expanded := createExpandedAppsList(device, apps)
@@ -274,12 +269,48 @@ func (s *Server) determineNextApp(ctx context.Context, device *data.Device, user
 		return nil, 0, nil
 	}
 
+	// Memoize schedule checks: the loop may visit each app up to twice, and
+	// interstitial positions re-check the preceding app.
+	activeCache := make(map[*data.App]bool, len(apps))
+	isActive := func(app *data.App) bool {
+		active, ok := activeCache[app]
+		if !ok {
+			active = app.Enabled && IsAppScheduleActiveAtTime(app, now)
+			activeCache[app] = active
+		}
+		return active
+	}
+
+	// Loop to find next valid app. Selection is pure; only rendering has side
+	// effects, so a failed render just resumes the search after that index.
 	lastIndex := device.LastAppIndex
+	remaining := len(expanded) * 2
+	for remaining > 0 {
+		candidate, nextIndex, steps := pickNextApp(device, expanded, lastIndex, remaining, isActive)
+		if candidate == nil {
+			break
+		}
+		if s.possiblyRender(ctx, candidate, device, user) && !candidate.EmptyLastRender {
+			return candidate, nextIndex, nil
+		}
+		// Stop trying more apps if context was canceled (e.g., request timed out)
+		if ctx.Err() != nil {
+			slog.Debug("Context canceled during app iteration, stopping", "device", device.ID)
+			return nil, 0, ctx.Err()
+		}
+		lastIndex = nextIndex
+		remaining -= steps
+	}
 
-	// Loop to find next valid app
-	for i := 0; i < len(expanded)*2; i++ {
-		nextIndex := (lastIndex + 1) % len(expanded)
+	return nil, 0, nil
+}
 
+// pickNextApp scans at most maxSteps positions of the expanded rotation after
+// lastIndex and returns the first app that should be displayed, its index and
+// the number of positions consumed. It returns a nil app if none qualifies.
+func pickNextApp(device *data.Device, expanded []*data.App, lastIndex, maxSteps int, isActive func(*data.App) bool) (*data.App, int, int) {
+	for step := 1; step <= maxSteps; step++ {
+		nextIndex := (lastIndex + step) % len(expanded)
 		candidate := expanded[nextIndex]
 
 		isInterstitialPos := device.InterstitialEnabled && nextIndex%2 == 1
@@ -292,12 +323,11 @@ func (s *Server) determineNextApp(ctx context.Context, device *data.Device, user
 			// So an interstitial at index i corresponds to App at i-1.
 			if nextIndex > 0 {
 				prevApp := expanded[nextIndex-1]
-				prevActive := prevApp.Enabled && IsAppScheduleActive(prevApp, device)
-				if !prevActive {
+				if !isActive(prevApp) {
 					shouldDisplay = false
 				}
 			}
-		} else if candidate.Enabled && IsAppScheduleActive(candidate, device) {
+		} else if isActive(candidate) {
 			shouldDisplay = true
 		}
 
@@ -308,20 +338,25 @@ func (s *Server) determineNextApp(ctx context.Context, device *data.Device, user
 		}
 
 		if shouldDisplay {
-			if s.possiblyRender(ctx, candidate, device, user) && !candidate.EmptyLastRender {
-				return candidate, nextIndex, nil
-			}
-			// Stop trying more apps if context was canceled (e.g., request timed out)
-			if ctx.Err() != nil {
-				slog.Debug("Context canceled during app iteration, stopping", "device", device.ID)
-				return nil, 0, ctx.Err()
-			}
+			return candidate, nextIndex, step
 		}
-
-		lastIndex = nextIndex
 	}
+	return nil, 0, maxSteps
+}
 
-	return nil, 0, nil
+// appsInOrder returns apps sorted by Order. Devices are loaded with
+// orderedAppsPreload, so the list is normally already sorted and is returned
+// as-is; otherwise a sorted copy is made. Callers must not modify the result.
+func appsInOrder(apps []*data.App) []*data.App {
+	byOrder := func(a, b *data.App) int {
+		return cmp.Compare(a.Order, b.Order)
+	}
+	if slices.IsSortedFunc(apps, byOrder) {
+		return apps
+	}
+	sorted := slices.Clone(apps)
+	slices.SortStableFunc(sorted, byOrder)
+	return sorted
 }
 
 func createExpandedAppsList(device *data.Device, apps []*data.App) []*data.App {
@@ -344,7 +379,7 @@ func createExpandedAppsList(device *data.Device, apps []*data.App) []*data.App {
 		return apps
 	}
 
-	expanded := make([]*data.App, 0, len(device.Apps)*10) // Pre-allocate to a reasonable size
+	expanded := make([]*data.App, 0, 2*len(apps)) // Each app plus the interstitial after it
 	for i, app := range apps {
 		expanded = append(expanded, app)
 		// Add interstitial after each regular app, except the last one
@@ -367,6 +402,34 @@ func (s *Server) getAppWebpPath(deviceWebpDir string, app *data.App) string {
 		}
 		return path
 	}
-	appBasename := fmt.Sprintf("%s-%s", app.Name, app.Iname)
-	return filepath.Join(deviceWebpDir, fmt.Sprintf("%s.webp", appBasename))
+	return filepath.Join(deviceWebpDir, appWebpName(app))
+}
+
+// appWebpName returns the file name of an installation's rendered image
+// within the device webp directory.
+func appWebpName(app *data.App) string {
+	return app.Name + "-" + app.Iname + ".webp"
+}
+
+// listEphemeralImages returns the names of anonymous pushed images (__*.webp)
+// in pushedDir, sorted by name (oldest first). This runs on every device poll,
+// so it relies on the entry types os.ReadDir gets from the directory read to
+// skip subdirectories without a stat per file. A missing directory yields nil.
+func listEphemeralImages(pushedDir string) []string {
+	entries, err := os.ReadDir(pushedDir)
+	if err != nil {
+		if !errors.Is(err, os.ErrNotExist) {
+			slog.Warn("Failed to list pushed image directory", "path", pushedDir, "error", err)
+		}
+		return nil
+	}
+
+	var ephemeral []string
+	for _, e := range entries {
+		name := e.Name()
+		if !e.IsDir() && strings.HasPrefix(name, "__") && strings.HasSuffix(name, ".webp") {
+			ephemeral = append(ephemeral, name)
+		}
+	}
+	return ephemeral
 }
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"slices"
 	"strings"
 	"testing"
 	"time"
@@ -446,6 +447,53 @@ func TestDetermineNextApp_AutoPin(t *testing.T) {
 	}
 }
 
+func TestPickNextApp(t *testing.T) {
+	appA := &data.App{Iname: "a", Enabled: true}
+	appB := &data.App{Iname: "b", Enabled: false}
+	appC := &data.App{Iname: "c", Enabled: true}
+	device := &data.Device{}
+	expanded := []*data.App{appA, appB, appC}
+	isActive := func(app *data.App) bool { return app.Enabled }
+
+	// Starting after A, B is disabled so C is picked after two steps
+	app, idx, steps := pickNextApp(device, expanded, 0, len(expanded)*2, isActive)
+	if app != appC || idx != 2 || steps != 2 {
+		t.Errorf("expected c at index 2 after 2 steps, got %v at %d after %d", app, idx, steps)
+	}
+
+	// Wraps around to the start of the rotation
+	app, idx, _ = pickNextApp(device, expanded, 2, len(expanded)*2, isActive)
+	if app != appA || idx != 0 {
+		t.Errorf("expected a at index 0, got %v at %d", app, idx)
+	}
+
+	// Nothing qualifies within the step budget
+	app, _, steps = pickNextApp(device, expanded, 0, 1, isActive)
+	if app != nil || steps != 1 {
+		t.Errorf("expected no app after 1 step, got %v after %d", app, steps)
+	}
+}
+
+func TestDetermineNextApp_AllDisabled(t *testing.T) {
+	s := newTestServer(t)
+	device := data.Device{
+		ID:       "device1",
+		Username: "testuser",
+		Apps: []*data.App{
+			{Iname: "a", Enabled: false, Pushed: true},
+			{Iname: "b", Enabled: false, Pushed: true, Order: 1},
+		},
+	}
+
+	app, _, err := s.determineNextApp(context.Background(), &device, &data.User{Username: "testuser"})
+	if err != nil {
+		t.Fatalf("determineNextApp failed: %v", err)
+	}
+	if app != nil {
+		t.Errorf("expected no app when all are disabled, got %s", app.Iname)
+	}
+}
+
 func TestGetNextAppImage_EphemeralCleanup(t *testing.T) {
 	s := newTestServer(t)
 	ctx := context.Background()
@@ -574,3 +622,25 @@ func countPrefix(entries []os.DirEntry, prefix string) int {
 	}
 	return count
 }
+
+func TestListEphemeralImages(t *testing.T) {
+	pushedDir := t.TempDir()
+	for _, name := range []string{"__2.webp", "__1.webp", "named.webp", "__3.txt"} {
+		if err := os.WriteFile(filepath.Join(pushedDir, name), []byte("RIFF"), 0644); err != nil {
+			t.Fatal(err)
+		}
+	}
+	if err := os.Mkdir(filepath.Join(pushedDir, "__dir.webp"), 0755); err != nil {
+		t.Fatal(err)
+	}
+
+	got := listEphemeralImages(pushedDir)
+	want := []string{"__1.webp", "__2.webp"}
+	if !slices.Equal(got, want) {
+		t.Errorf("listEphemeralImages() = %v, want %v", got, want)
+	}
+
+	if got := listEphemeralImages(filepath.Join(pushedDir, "missing")); got != nil {
+		t.Errorf("listEphemeralImages() on a missing dir = %v, want nil", got)
+	}
+}
@@ -5,25 +5,32 @@ import (
 	"time"
 
 	"tronbyt-server/internal/data"
+	"tronbyt-server/internal/tzcache"
 )
 
 // IsAppScheduleActive checks if an app's schedule is active.
 func IsAppScheduleActive(app *data.App, device *data.Device) bool {
+	return IsAppScheduleActiveAtTime(app, deviceScheduleTime(device))
+}
+
+// deviceScheduleTime returns the current time in the device's timezone.
+// Callers that evaluate several apps should compute it once and use
+// IsAppScheduleActiveAtTime so the timezone is only resolved once.
+func deviceScheduleTime(device *data.Device) time.Time {
 	// 1. Get Device Timezone
 	loc := time.Local // Default
 	if device.Timezone != nil {
-		if l, err := time.LoadLocation(*device.Timezone); err == nil {
+		if l, err := tzcache.LoadLocation(*device.Timezone); err == nil {
 			loc = l
 		}
 	} else if device.Location.Timezone != "" {
 		// Try to get timezone from location (stored in JSON)
-		if l, err := time.LoadLocation(device.Location.Timezone); err == nil {
+		if l, err := tzcache.LoadLocation(device.Location.Timezone); err == nil {
 			loc = l
 		}
 	}
 
-	currentTime := time.Now().In(loc)
-	return IsAppScheduleActiveAtTime(app, currentTime)
+	return time.Now().In(loc)
 }
 
 // IsAppScheduleActiveAtTime checks if app should be active at the given time.
@@ -14,6 +14,7 @@ import (
 	"net/http/pprof"
 	"os"
 	"path/filepath"
+	"runtime"
 	"strconv"
 	"strings"
 	"sync"
@@ -21,6 +22,7 @@ import (
 
 	"tronbyt-server/internal/apps"
 	"tronbyt-server/internal/config"
+	"tronbyt-server/internal/gitutils"
 	syncer "tronbyt-server/internal/sync"
 	"tronbyt-server/web"
 
@@ -51,8 +53,38 @@ type Server struct {
 	OIDCProvider  *OIDCProvider
 
 	systemAppsCache      []apps.AppMetadata
+	systemAppsByID       map[string]int // index into systemAppsCache
+	systemAppsByPath     map[string]int // index into systemAppsCache
 	systemAppsCacheMutex sync.RWMutex
 
+	// Serializes git operations on the system apps checkout.
+	systemRepoMutex sync.Mutex
+
+	// Details of the system apps checkout, see getSystemRepoInfo. Guarded by
+	// systemAppsCacheMutex; systemRepoGen counts syncs.
+	systemRepoInfo *gitutils.RepoInfo
+	systemRepoGen  uint64
+
+	userAppsCache      map[string]userAppsCacheEntry
+	userAppsCacheMutex sync.RWMutex
+
+	// Resolved device webp directory paths, keyed by device ID.
+	deviceImageDirs sync.Map
+
+	// Most recent config preview per installation, see cachedPreview.
+	previewCache sync.Map
+
+	// Bounds concurrent pixlet renders from all callers, see RenderApp.
+	renderLimit chan struct{}
+
+	// Renders queued by handlers that don't wait for the result. Pending
+	// renders are deduplicated per installation, and at most
+	// cap(backgroundSlots) of them run at once. That is half of renderLimit,
+	// so device polls always have render capacity left.
+	pendingRenders   sync.Map
+	backgroundSlots  chan struct{}
+	backgroundRender sync.WaitGroup
+
 	// SchemaCache, when set, allows forcing a one-shot refetch of an app's
 	// cached HTTP responses so dynamic schema data (e.g. dropdown options
 	// fetched in get_schema) can be refreshed before the app's TTL expires.
@@ -103,8 +135,10 @@ func NewServer(db *gorm.DB, cfg *config.Settings) *Server {
 				return true
 			},
 		},
-		PromRegistry: prometheus.DefaultRegisterer,
-		PromGatherer: prometheus.DefaultGatherer,
+		PromRegistry:    prometheus.DefaultRegisterer,
+		PromGatherer:    prometheus.DefaultGatherer,
+		renderLimit:     make(chan struct{}, runtime.NumCPU()),
+		backgroundSlots: make(chan struct{}, max(1, runtime.NumCPU()/2)),
 	}
 
 	// Load Settings from DB
@@ -384,9 +418,10 @@ func (s *Server) GetTmpDir() string {
 }
 
 func (s *Server) handleDots(w http.ResponseWriter, r *http.Request) {
-	widthStr := r.URL.Query().Get("w")
-	heightStr := r.URL.Query().Get("h")
-	radiusStr := r.URL.Query().Get("r")
+	query := r.URL.Query()
+	widthStr := query.Get("w")
+	heightStr := query.Get("h")
+	radiusStr := query.Get("r")
 
 	width := 64
 	height := 32
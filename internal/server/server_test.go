@@ -50,6 +50,9 @@ func newTestServer(t *testing.T, opts ...option) *Server {
 	}
 
 	s := NewServer(db, cfg)
+	// Background renders write into DataDir; let them finish before the
+	// temp dir is removed.
+	t.Cleanup(s.backgroundRender.Wait)
 	return s
 }
 
@@ -328,7 +328,7 @@ func (s *Server) wsWriteLoop(ctx context.Context, conn *websocket.Conn, initialD
 				// If just Queued, we keep waiting for Displaying.
 			case val := <-broadcastCh:
 				// Update available (Reload device first)
-				reloaded, err := gorm.G[data.Device](s.DB).Preload("Apps", nil).Where("id = ?", initialDevice.ID).First(ctx)
+				reloaded, err := gorm.G[data.Device](s.DB).Preload("Apps", orderedAppsPreload).Where("id = ?", initialDevice.ID).First(ctx)
 				if err != nil {
 					slog.Error("Device gone", "id", initialDevice.ID)
 					return
@@ -471,7 +471,7 @@ func (s *Server) SetupWebsocketRoutes() {
 }
 
 func (s *Server) reloadDevice(deviceID string) (*data.Device, error) {
-	device, err := gorm.G[data.Device](s.DB).Preload("Apps", nil).Where("id = ?", deviceID).First(context.Background())
+	device, err := gorm.G[data.Device](s.DB).Preload("Apps", orderedAppsPreload).Where("id = ?", deviceID).First(context.Background())
 	if err != nil {
 		if errors.Is(err, gorm.ErrRecordNotFound) {
 			return nil, fmt.Errorf("device not found: %s", deviceID)
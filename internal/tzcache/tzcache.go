@@ -0,0 +1,27 @@
+// Package tzcache caches time zone lookups shared by the data models, the
+// renderer and the server.
+package tzcache
+
+import (
+	"sync"
+	"time"
+)
+
+// locationCache memoizes LoadLocation, keyed by zone name.
+var locationCache sync.Map
+
+// LoadLocation is a cached time.LoadLocation. The standard library reads and
+// parses the zoneinfo file on every call; zone data doesn't change while the
+// server runs, so successfully loaded locations are reused. Failures are not
+// cached.
+func LoadLocation(name string) (*time.Location, error) {
+	if loc, ok := locationCache.Load(name); ok {
+		return loc.(*time.Location), nil
+	}
+	loc, err := time.LoadLocation(name)
+	if err != nil {
+		return nil, err
+	}
+	locationCache.Store(name, loc)
+	return loc, nil
+}
@@ -0,0 +1,19 @@
+package tzcache
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestLoadLocationCached(t *testing.T) {
+	first, err := LoadLocation("Europe/Berlin")
+	require.NoError(t, err)
+	second, err := LoadLocation("Europe/Berlin")
+	require.NoError(t, err)
+	assert.Same(t, first, second)
+
+	_, err = LoadLocation("Not/AZone")
+	assert.Error(t, err)
+}